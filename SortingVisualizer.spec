@@ -11,8 +11,34 @@ a = Analysis(
         ('insertion_sort.py', '.'),
         ('merge_sort.py', '.'),
         ('quick_sort.py', '.'),
+        ('render_scheduler.py', '.'),
+        ('array_patterns.py', '.'),
+        ('events.py', '.'),
+        ('sort_trace.py', '.'),
+        ('registry.py', '.'),
+        ('array_model.py', '.'),
+        ('image_renderer.py', '.'),
+        ('pacing.py', '.'),
+        ('race_mode.py', '.'),
+        ('counters.py', '.'),
+        ('profiler.py', '.'),
+        ('tim_sort.py', '.'),
+        ('intro_sort.py', '.'),
+        ('counting_sort.py', '.'),
+        ('radix_sort.py', '.'),
+        ('bucket_sort.py', '.'),
+        ('heap_sort.py', '.'),
+        ('block_merge_sort.py', '.'),
+        ('parallel_merge_sort.py', '.'),
     ],
-    hiddenimports=['visualizer', 'bubble_sort', 'selection_sort', 'insertion_sort', 'merge_sort', 'quick_sort'],
+    hiddenimports=['visualizer', 'bubble_sort', 'selection_sort', 'insertion_sort', 'merge_sort', 'quick_sort',
+                   'render_scheduler', 'array_patterns', 'events', 'sort_trace',
+                   'registry', 'array_model', 'image_renderer',
+                   'pacing', 'race_mode', 'counters',
+                   'profiler', 'tim_sort', 'intro_sort',
+                   'counting_sort', 'radix_sort', 'bucket_sort',
+                   'heap_sort', 'block_merge_sort',
+                   'parallel_merge_sort'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
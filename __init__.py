@@ -1,18 +1,45 @@
 """
 Sorting Algorithms Package
 Contains individual sorting algorithm implementations.
+
+Algorithm modules are imported lazily: the functions below are only
+loaded when first accessed, and the registry module lists every
+algorithm (including entry-point plugins) by display name.
 """
 
-from .bubble_sort import bubble_sort
-from .selection_sort import selection_sort
-from .insertion_sort import insertion_sort
-from .merge_sort import merge_sort
-from .quick_sort import quick_sort
+import importlib
+import os
+import sys
+
+# The algorithm modules import their siblings (e.g. events) by top-level
+# name, the same way main.py runs them
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from .registry import algorithm_names, get_algorithm
+
+# Function name -> module that defines it
+_LAZY_FUNCTIONS = {
+    'bubble_sort': 'bubble_sort',
+    'selection_sort': 'selection_sort',
+    'insertion_sort': 'insertion_sort',
+    'merge_sort': 'merge_sort',
+    'quick_sort': 'quick_sort',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_FUNCTIONS:
+        module = importlib.import_module('.' + _LAZY_FUNCTIONS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'bubble_sort',
     'selection_sort',
     'insertion_sort',
     'merge_sort',
-    'quick_sort'
+    'quick_sort',
+    'algorithm_names',
+    'get_algorithm',
 ]
@@ -0,0 +1,141 @@
+"""
+Array Model
+===========
+Bar geometry and highlight state for the array being visualized.
+
+The values themselves stay a plain Python list shared with the sorting
+algorithms, which index it one element at a time (much faster on a list
+than on a NumPy array). What the model adds is everything the renderer
+needs per bar: the x extent of every bar and the value scale, computed in
+one pass per layout, the cached maximum value, and a per-index highlight
+state array mapped to colors through a small palette.
+
+NumPy is optional. When it is installed the geometry is computed with
+vectorized operations; otherwise the same arithmetic runs in plain Python.
+"""
+
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Highlight states; a bar's state code indexes into the palette
+STATE_KEYS = ('normal', 'comparing', 'swapping', 'sorted', 'pivot')
+STATE_CODES = {key: code for code, key in enumerate(STATE_KEYS)}
+
+# Horizontal margin on each side of the bars, in pixels
+MARGIN = 10
+
+
+class ArrayModel:
+    """
+    Rendering data for one array: bar geometry, max value and highlight state.
+
+    Attributes:
+        values (List[int]): The array being visualized (shared, not copied)
+        max_value (int): Cached maximum of values (at least 1)
+        palette (List[str]): Fill color for each state code
+        state: Per-index state codes (NumPy uint8 array or bytearray)
+        bar_width (float): Width of one bar slot in pixels
+        bar_gap (int): Gap between neighbouring bars in pixels
+    """
+
+    def __init__(self, values: List[int], colors: Dict[str, str]):
+        """
+        Create a model for an array.
+
+        Args:
+            values: The array being visualized
+            colors: Color for each key in STATE_KEYS
+        """
+        self.values = values
+        self.max_value = max(values, default=0) or 1
+        self.palette = [colors[key] for key in STATE_KEYS]
+        n = len(values)
+        self.state = np.zeros(n, dtype=np.uint8) if np is not None else bytearray(n)
+
+        self.bar_width = 0.0
+        self.bar_gap = 0
+        self.baseline = 0.0
+        self.scale = 0.0
+        self._x1: List[float] = []
+        self._x2: List[float] = []
+
+    def layout(self, width: int, height: int, left: int = 0, top: int = 0) -> None:
+        """
+        Compute the geometry of every bar for a drawing area.
+
+        Args:
+            width: Drawing area width in pixels
+            height: Drawing area height in pixels
+            left: x of the drawing area's left edge on the canvas
+            top: y of the drawing area's top edge on the canvas
+        """
+        n = len(self.values)
+        if not n:
+            return
+        self.bar_width = (width - 2 * MARGIN) / n
+        self.bar_gap = 2 if self.bar_width > 4 else 0
+        self.baseline = top + height - 20
+        self.scale = (height - 40) / self.max_value
+        bar_span = max(self.bar_width - self.bar_gap, 1)
+
+        if np is not None:
+            x1 = left + MARGIN + np.arange(n) * self.bar_width
+            self._x1 = x1.tolist()
+            self._x2 = (x1 + bar_span).tolist()
+        else:
+            self._x1 = [left + MARGIN + i * self.bar_width for i in range(n)]
+            self._x2 = [x + bar_span for x in self._x1]
+
+    def coords(self, i: int) -> Tuple[float, float, float, float]:
+        """Return the (x1, y1, x2, y2) rectangle for the bar at index i."""
+        return (self._x1[i], self.baseline, self._x2[i],
+                self.baseline - self.values[i] * self.scale)
+
+    def all_coords(self) -> List[Tuple[float, float, float, float]]:
+        """Return the rectangles of every bar, computed in one pass."""
+        if np is not None:
+            tops = (self.baseline - np.asarray(self.values, dtype=float) * self.scale).tolist()
+        else:
+            tops = [self.baseline - v * self.scale for v in self.values]
+        baseline = self.baseline
+        return [(x1, baseline, x2, top) for x1, x2, top in zip(self._x1, self._x2, tops)]
+
+    def set_state(self, i: int, key: str) -> str:
+        """
+        Set the highlight state of a bar.
+
+        Args:
+            i: Bar index
+            key: State key from STATE_KEYS (unknown keys become 'normal')
+
+        Returns:
+            The fill color for the new state
+        """
+        code = STATE_CODES.get(key, 0)
+        self.state[i] = code
+        return self.palette[code]
+
+    def fill(self, key: str) -> str:
+        """
+        Set every bar to the same highlight state.
+
+        Args:
+            key: State key from STATE_KEYS
+
+        Returns:
+            The fill color for that state
+        """
+        code = STATE_CODES.get(key, 0)
+        if np is not None:
+            self.state.fill(code)
+        else:
+            self.state[:] = bytes((code,)) * len(self.state)
+        return self.palette[code]
+
+    def color(self, i: int) -> str:
+        """Return the fill color for the current state of bar i."""
+        return self.palette[self.state[i]]
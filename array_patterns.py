@@ -0,0 +1,268 @@
+"""
+Array Patterns
+==============
+Input generators shared by the GUI and the headless benchmark runner.
+
+Patterns available:
+- Random: Completely random values
+- Nearly Sorted: Array with a few elements out of place
+- Reversed: Array in descending order
+- Few Unique: Array with limited unique values (tests stability)
+- Sawtooth: Repeated ascending ramps
+- Organ Pipe: Ascending to the middle, then descending
+- Zipf Duplicates: A few values very common, most values rare
+- Sorted Runs: Sorted (and some reversed) runs of random lengths
+- Quicksort Killer: Adversarial input that drives quick sort to O(n²)
+
+Every generator draws from its own ``random.Random(seed)``, never from the
+global random state, so the same (pattern, size, seed) always gives the
+same array. The one exception is "Quicksort Killer", which is built by
+playing the adversary against the quick sort and so ignores the seed:
+every seed gives the same array for a given size. Values are produced
+lazily by ``iter_pattern`` and random draws are made in bulk
+(``Random.choices``) rather than one call per element.
+"""
+
+import math
+import random
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from registry import get_algorithm
+
+# Value range of the patterns whose values don't depend on the size
+LOW = 10
+HIGH = 390
+
+# Random draws are made this many elements at a time
+CHUNK_SIZE = 1 << 16
+
+# Shortest run produced by "Sorted Runs"
+MIN_RUN = 8
+
+# Algorithm the "Quicksort Killer" input is built against. Building it
+# runs that algorithm once (quadratically), hence the size limit.
+KILLER_TARGET = "Quick Sort (Iterative)"
+KILLER_MAX_SIZE = 5000
+
+# Built "Quicksort Killer" arrays kept for reuse, one per size
+KILLER_CACHE_SIZE = 32
+
+# Patterns slow enough to build that interactive callers should generate
+# them off their main thread
+SLOW_PATTERNS = frozenset({"Quicksort Killer"})
+
+
+def _top(size: int) -> int:
+    """Return the largest value of a size-dependent pattern (4 apart per element)."""
+    return max(HIGH, LOW + (size - 1) * 4)
+
+
+def _draw(population, size: int, rng: random.Random,
+          cum_weights: Optional[List[float]] = None) -> Iterator[int]:
+    """Yield size values drawn from population, CHUNK_SIZE at a time."""
+    for start in range(0, size, CHUNK_SIZE):
+        yield from rng.choices(population, cum_weights=cum_weights,
+                               k=min(CHUNK_SIZE, size - start))
+
+
+def _random(size: int, rng: random.Random) -> Iterable[int]:
+    return _draw(range(LOW, HIGH + 1), size, rng)
+
+
+def _nearly_sorted(size: int, rng: random.Random) -> Iterable[int]:
+    # Create sorted array then swap ~10% of elements in random pairs
+    array = list(range(LOW, LOW + size * 4, 4))
+    if size >= 2:
+        for _ in range(max(1, size // 10)):
+            i, j = rng.sample(range(size), 2)
+            array[i], array[j] = array[j], array[i]
+    return array
+
+
+def _reversed(size: int, rng: random.Random) -> Iterable[int]:
+    # Descending order - worst case for many algorithms.
+    # Start high enough that large arrays stay positive.
+    top = _top(size)
+    return range(top, top - size * 4, -4)
+
+
+def _few_unique(size: int, rng: random.Random) -> Iterable[int]:
+    # Only 5 unique values - tests algorithm behavior with duplicates
+    return _draw((50, 150, 200, 300, 350), size, rng)
+
+
+def _sawtooth(size: int, rng: random.Random) -> Iterable[int]:
+    # About sqrt(n) teeth of sqrt(n) ascending elements each
+    period = max(2, int(math.sqrt(size)))
+    step = (_top(size) - LOW) / (period - 1)
+    return (LOW + round((i % period) * step) for i in range(size))
+
+
+def _organ_pipe(size: int, rng: random.Random) -> Iterable[int]:
+    half = max((size - 1) / 2, 1)
+    span = _top(size) - LOW
+    return (LOW + round(min(i, size - 1 - i) / half * span) for i in range(size))
+
+
+def _zipf_duplicates(size: int, rng: random.Random) -> Iterable[int]:
+    # The k-th most common value appears with probability proportional to 1/k
+    values = list(range(LOW, HIGH + 1, 4))
+    rng.shuffle(values)
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(values) + 1)))
+    return _draw(values, size, rng, cum_weights)
+
+
+def _sorted_runs(size: int, rng: random.Random) -> Iterator[int]:
+    # Runs of MIN_RUN..n/8 sorted values; one run in four is descending
+    longest = max(MIN_RUN, size // 8)
+    produced = 0
+    while produced < size:
+        length = min(size - produced, rng.randint(MIN_RUN, longest))
+        yield from sorted(rng.choices(range(LOW, HIGH + 1), k=length),
+                          reverse=rng.random() < 0.25)
+        produced += length
+
+
+def _quicksort_killer(size: int, rng: random.Random) -> Iterable[int]:
+    # Deterministic: the adversary draws nothing from rng, so the array
+    # only depends on the size and can be cached by it
+    return _cached_killer(size)
+
+
+@lru_cache(maxsize=KILLER_CACHE_SIZE)
+def _cached_killer(size: int) -> Tuple[int, ...]:
+    """Build the "Quicksort Killer" array of a size (a tuple: it is shared)."""
+    return tuple(killer_input(get_algorithm(KILLER_TARGET)["entry"], size))
+
+
+_GENERATORS: Dict[str, Callable[[int, random.Random], Iterable[int]]] = {
+    "Random": _random,
+    "Nearly Sorted": _nearly_sorted,
+    "Reversed": _reversed,
+    "Few Unique": _few_unique,
+    "Sawtooth": _sawtooth,
+    "Organ Pipe": _organ_pipe,
+    "Zipf Duplicates": _zipf_duplicates,
+    "Sorted Runs": _sorted_runs,
+    "Quicksort Killer": _quicksort_killer,
+}
+
+PATTERNS = list(_GENERATORS)
+
+
+def killer_input(sort_func, size: int) -> List[int]:
+    """
+    Build an input that makes a comparison sort do as much work as possible.
+
+    McIlroy's "killer adversary": the sort is run on placeholder elements
+    whose values are decided lazily during the comparisons. All start out
+    as "gas" (larger than any decided value); when two gas elements are
+    compared one of them is frozen to the next smallest value, preferring
+    the one that is not the current pivot candidate. For a quick sort this
+    keeps every pivot as small as possible, so every partition is maximally
+    unbalanced. Replaying the sort on the resulting values repeats exactly
+    the same comparisons.
+
+    Args:
+        sort_func: Step generator of a comparison sort (see events.py)
+        size: Number of elements
+
+    Returns:
+        The adversarial array
+    """
+    gas = size
+    values = [gas] * size
+    solid = 0
+    candidate = -1
+
+    def compare(x: int, y: int) -> int:
+        nonlocal solid, candidate
+        if values[x] == gas and values[y] == gas:
+            frozen = x if x == candidate else y
+            values[frozen] = solid
+            solid += 1
+        if values[x] == gas:
+            candidate = x
+        elif values[y] == gas:
+            candidate = y
+        return values[x] - values[y]
+
+    class Placeholder:
+        __slots__ = ('index',)
+
+        def __init__(self, index):
+            self.index = index
+
+        def __lt__(self, other):
+            return compare(self.index, other.index) < 0
+
+        def __le__(self, other):
+            return compare(self.index, other.index) <= 0
+
+        def __gt__(self, other):
+            return compare(self.index, other.index) > 0
+
+        def __ge__(self, other):
+            return compare(self.index, other.index) >= 0
+
+        def __eq__(self, other):
+            return compare(self.index, other.index) == 0
+
+        def __ne__(self, other):
+            return compare(self.index, other.index) != 0
+
+    for _ in sort_func([Placeholder(i) for i in range(size)]):
+        pass
+    return [LOW + value * 4 for value in values]
+
+
+def new_seed() -> int:
+    """Return a fresh seed for callers that want a different array every time."""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def iter_pattern(pattern: str, size: int, seed: Optional[int] = None) -> Iterator[int]:
+    """
+    Lazily generate the values of an array following a pattern.
+
+    Args:
+        pattern: One of PATTERNS
+        size: Number of elements
+        seed: Seed for the pattern's random generator (None for a fresh
+            one); ignored by "Quicksort Killer", which is deterministic
+
+    Returns:
+        An iterator over the size values
+
+    Raises:
+        ValueError: If the pattern is unknown, or the size is too large
+            for "Quicksort Killer"
+    """
+    generator = _GENERATORS.get(pattern)
+    if generator is None:
+        raise ValueError(f"Unknown array pattern: {pattern}")
+    if pattern == "Quicksort Killer" and size > KILLER_MAX_SIZE:
+        raise ValueError(f"{pattern} inputs are limited to {KILLER_MAX_SIZE:,} elements")
+    return iter(generator(size, random.Random(seed)))
+
+
+def generate_array(pattern: str, size: int, seed: Optional[int] = None) -> List[int]:
+    """
+    Generate a new array of the given size following a pattern.
+
+    Args:
+        pattern: One of PATTERNS
+        size: Number of elements
+        seed: Seed for the pattern's random generator (None for a fresh
+            one); ignored by "Quicksort Killer", which is deterministic
+
+    Returns:
+        The generated array
+
+    Raises:
+        ValueError: If the pattern is unknown, or the size is too large
+            for "Quicksort Killer"
+    """
+    return list(iter_pattern(pattern, size, seed))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Sorting Algorithm Benchmark - Headless Entry Point
+===================================================
+
+Runs every sorting algorithm without the GUI against each array pattern
+over a sweep of sizes and seeds and reports wall time, comparisons, swaps,
+peak auxiliary memory and operations per second as CSV or JSON. The
+algorithms' step events are only counted, never drawn, so the numbers
+reflect the algorithms themselves.
+
+Each (algorithm, pattern, size, seed) combination is an independent job.
+Jobs are fanned out over a process pool (one worker per core by default)
+and the results are merged into one report in sweep order. A per-job time
+limit stops the quadratic sorts on large inputs instead of letting them
+hold a worker for hours; such jobs are reported with status "timeout".
+
+Usage:
+------
+    python benchmark.py
+    python benchmark.py --sizes 100 1000 --patterns Random Reversed
+    python benchmark.py --sizes 10 1000 100000 1000000 --seeds 0 1 2 --timeout 60
+    python benchmark.py --format json --output results.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Add current directory to path so imports work correctly
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from array_patterns import PATTERNS, generate_array
+from counters import SortCounters
+from registry import algorithm_names, get_algorithm
+
+DEFAULT_SIZES = [100, 250, 500, 1000]
+
+FIELDS = [
+    "algorithm", "pattern", "size", "seed", "wall_time_s",
+    "comparisons", "swaps", "writes", "reads", "aux_peak", "ops_per_sec",
+    "sorted", "status",
+]
+
+# Step events consumed between two checks of a job's time limit
+DEADLINE_CHECK_EVENTS = 1 << 14
+
+# A job: (algorithm, pattern, size, seed)
+Job = Tuple[str, str, int, Optional[int]]
+
+
+def run_benchmark(algorithm: str, pattern: str, size: int,
+                  seed: Optional[int] = None, repeat: int = 1,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Run one algorithm on one generated array and measure it.
+
+    The same input is sorted ``repeat`` times; the fastest wall time is
+    reported. If the runs together exceed ``timeout`` seconds the sort is
+    abandoned and the row is reported with status "timeout" and the
+    counts reached so far. Patterns that cannot be generated at this size
+    give a row with status "skipped".
+
+    Args:
+        algorithm: Registered algorithm name
+        pattern: Array pattern passed to generate_array
+        size: Number of elements
+        seed: Seed for the pattern generator, for reproducible inputs
+              (None for a different input on every call)
+        repeat: Number of runs on the same input
+        timeout: Time limit for the job in seconds (None for no limit)
+
+    Returns:
+        A result row with the keys listed in FIELDS
+    """
+    sort_func = get_algorithm(algorithm)["entry"]
+    try:
+        source = generate_array(pattern, size, seed)
+    except ValueError:
+        # The pattern can't be built at this size ("Quicksort Killer")
+        row = dict.fromkeys(FIELDS, 0)
+        row.update(algorithm=algorithm, pattern=pattern, size=size, seed=seed,
+                   sorted=False, status="skipped")
+        return row
+    deadline = time.perf_counter() + timeout if timeout else None
+
+    best = float('inf')
+    array = source
+    counters = SortCounters()
+    status = "ok"
+    for _ in range(max(1, repeat)):
+        array = list(source)
+        counters.reset()
+        record = counters.record
+        start = time.perf_counter()
+        # Plugin algorithms may return any iterator, not only a generator
+        events = iter(sort_func(array))
+        # Consume the events in chunks so the deadline costs nothing per event
+        while True:
+            chunk = list(islice(events, DEADLINE_CHECK_EVENTS))
+            for op, a, b in chunk:
+                record(op, a, b)
+            if len(chunk) < DEADLINE_CHECK_EVENTS:
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                close = getattr(events, "close", None)
+                if close is not None:
+                    close()
+                status = "timeout"
+                break
+        best = min(best, time.perf_counter() - start)
+        if status != "ok":
+            break
+
+    ops = counters.comparisons + counters.swaps
+    return {
+        "algorithm": algorithm,
+        "pattern": pattern,
+        "size": size,
+        "seed": seed,
+        "wall_time_s": round(best, 6),
+        "comparisons": counters.comparisons,
+        "swaps": counters.swaps,
+        "writes": counters.writes,
+        "reads": counters.reads,
+        "aux_peak": counters.aux_peak,
+        "ops_per_sec": round(ops / best) if best > 0 else 0,
+        "sorted": status == "ok" and array == sorted(source),
+        "status": status,
+    }
+
+
+def _share_cpus(jobs: int) -> None:
+    """
+    Pool initializer: size nested worker pools to this job's share of the CPUs.
+
+    The parallel merge sort starts one worker per CPU by default; in every
+    job process of a full pool that would oversubscribe the machine and
+    skew wall times, so it gets cpu_count // jobs workers instead.
+
+    Args:
+        jobs: Number of job processes in the pool
+    """
+    import parallel_merge_sort
+    parallel_merge_sort.DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) // jobs)
+
+
+def run_jobs(jobs: Sequence[Job], repeat: int = 1, timeout: Optional[float] = None,
+             workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run benchmark jobs, in parallel when more than one worker is allowed.
+
+    Every job is fully described by its arguments (including its seed), so
+    results do not depend on which process runs it or in what order. The
+    largest inputs are submitted first so they don't end up as stragglers.
+    Sorts that start their own worker processes share the CPUs with the
+    other jobs (see _share_cpus).
+
+    Args:
+        jobs: (algorithm, pattern, size, seed) tuples
+        repeat: Runs per input; the fastest is reported
+        timeout: Per-job time limit in seconds (None for no limit)
+        workers: Worker processes (None for one per CPU, 1 to run in-process)
+
+    Returns:
+        One result row per job, in the order of jobs
+    """
+    if workers == 1:
+        return [run_benchmark(*job, repeat=repeat, timeout=timeout) for job in jobs]
+
+    order = sorted(range(len(jobs)), key=lambda k: jobs[k][2], reverse=True)
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_share_cpus,
+                             initargs=(workers,)) as executor:
+        futures = {
+            k: executor.submit(run_benchmark, *jobs[k], repeat=repeat, timeout=timeout)
+            for k in order
+        }
+        return [futures[k].result() for k in range(len(jobs))]
+
+
+def write_results(results: List[Dict[str, Any]], fmt: str, stream) -> None:
+    """
+    Write benchmark rows to a stream.
+
+    Args:
+        results: Rows returned by run_benchmark
+        fmt: 'csv' or 'json'
+        stream: Writable text stream
+    """
+    if fmt == "json":
+        json.dump(results, stream, indent=2)
+        stream.write("\n")
+    else:
+        writer = csv.DictWriter(stream, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Parse command-line arguments and run the benchmark sweep.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms headless.")
+    parser.add_argument("--algorithms", nargs="+", choices=algorithm_names(),
+                        default=algorithm_names(), metavar="NAME",
+                        help="algorithms to run (default: all)")
+    parser.add_argument("--patterns", nargs="+", choices=PATTERNS,
+                        default=PATTERNS, metavar="PATTERN",
+                        help="array patterns to run (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="array sizes to sweep")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0],
+                        help="pattern generator seeds; each one is a separate input")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="runs per input; the fastest is reported")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="time limit per job in seconds (default: none)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU; 1 runs in-process)")
+    parser.add_argument("--format", choices=["csv", "json"], default="csv",
+                        help="output format")
+    parser.add_argument("--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    jobs = [
+        (algorithm, pattern, size, seed)
+        for algorithm in args.algorithms
+        for pattern in args.patterns
+        for size in args.sizes
+        for seed in args.seeds
+    ]
+    results = run_jobs(jobs, args.repeat, args.timeout, args.jobs)
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_results(results, args.format, f)
+    else:
+        write_results(results, args.format, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Block Merge Sort Algorithm
+Stable in-place merge sort: insertion-sorted blocks merged by rotations
+"""
+
+from events import COMPARE, SWAP
+from insertion_sort import insertion_sort_range
+
+# Length of the blocks insertion sorted before merging starts
+BLOCK_SIZE = 20
+
+
+def block_merge_sort(array):
+    """
+    Block Merge Sort: Stable merge sort that merges in place with block rotations.
+    Time Complexity: O(n log² n) moves, O(n log n) comparisons
+    Space Complexity: O(log n) - no buffers, only the merge recursion
+    Stability: Stable
+
+    Blocks of BLOCK_SIZE elements are insertion sorted (short, local
+    passes), then merged bottom-up in doubling widths. Each merge is the
+    SymMerge of Kim and Kutzner: a binary search splits the two runs so
+    that rotating the middle section puts every element of the first
+    half before every element of the second, and both halves are merged
+    recursively. Rotations are done with block swaps, so nothing is ever
+    copied out of the array. Merges of runs that are already in order
+    cost one comparison.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison, swap and write (see events.py).
+    """
+    n = len(array)
+
+    for low in range(0, n, BLOCK_SIZE):
+        yield from insertion_sort_range(array, low, min(low + BLOCK_SIZE, n) - 1)
+
+    width = BLOCK_SIZE
+    while width < n:
+        for low in range(0, n - width, 2 * width):
+            mid = low + width
+            high = min(mid + width, n)
+            yield COMPARE, mid - 1, mid
+            if array[mid] < array[mid - 1]:
+                yield from sym_merge(array, low, mid, high)
+        width *= 2
+
+
+def sym_merge(array, a, m, b):
+    """
+    Merge the sorted runs array[a:m] and array[m:b] in place.
+
+    Splits around the middle of array[a:b]: a binary search finds the
+    point where the two runs cross, the section between is rotated, and
+    each side is merged on its own. Single-element runs are placed with a
+    binary search and a shift.
+    """
+    if m - a == 1:
+        # Insert array[a] into array[m:b] after any equal elements
+        i, j = m, b
+        while i < j:
+            h = (i + j) // 2
+            yield COMPARE, h, a
+            if array[h] < array[a]:
+                i = h + 1
+            else:
+                j = h
+        for k in range(a, i - 1):
+            array[k], array[k + 1] = array[k + 1], array[k]
+            yield SWAP, k, k + 1
+        return
+
+    if b - m == 1:
+        # Insert array[m] into array[a:m] after any equal elements
+        i, j = a, m
+        while i < j:
+            h = (i + j) // 2
+            yield COMPARE, m, h
+            if not array[m] < array[h]:
+                i = h + 1
+            else:
+                j = h
+        for k in range(m, i, -1):
+            array[k], array[k - 1] = array[k - 1], array[k]
+            yield SWAP, k, k - 1
+        return
+
+    mid = (a + b) // 2
+    n = mid + m
+    if m > mid:
+        start, r = n - b, mid
+    else:
+        start, r = a, m
+    p = n - 1
+
+    while start < r:
+        c = (start + r) // 2
+        yield COMPARE, p - c, c
+        if not array[p - c] < array[c]:
+            start = c + 1
+        else:
+            r = c
+
+    end = n - start
+    if start < m < end:
+        yield from rotate(array, start, m, end)
+    if a < start < mid:
+        yield from sym_merge(array, a, start, mid)
+    if mid < end < b:
+        yield from sym_merge(array, mid, end, b)
+
+
+def rotate(array, a, m, b):
+    """Rotate array[a:b] so that array[m:b] comes first, by block swaps."""
+    i = m - a
+    j = b - m
+    while i != j:
+        if i > j:
+            yield from swap_range(array, m - i, m, j)
+            i -= j
+        else:
+            yield from swap_range(array, m - i, m + j - i, i)
+            j -= i
+    yield from swap_range(array, m - i, m, i)
+
+
+def swap_range(array, a, b, count):
+    """Swap the blocks array[a:a + count] and array[b:b + count]."""
+    for k in range(count):
+        array[a + k], array[b + k] = array[b + k], array[a + k]
+        yield SWAP, a + k, b + k
+
+
+ALGORITHMS = {
+    "Block Merge Sort (In-Place)": {
+        "entry": block_merge_sort,
+        "description": "Stable merge sort without buffers: insertion-sorted blocks\nare merged in place with binary searches and rotations.",
+        "time_complexity": "O(n log² n)",
+        "space_complexity": "O(log n)",
+        "stability": "Stable",
+        "best_case": "O(n) - already sorted",
+    },
+}
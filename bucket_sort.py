@@ -0,0 +1,68 @@
+"""
+Bucket Sort Algorithm
+Distribution into equal-width value ranges, then insertion sort
+"""
+
+from counting_sort import key_range
+from events import ALLOC, NO_INDEX, READ, WRITE
+from insertion_sort import insertion_sort_range
+
+
+def bucket_sort(array):
+    """
+    Bucket Sort: Deals elements into value ranges and sorts each range.
+    Time Complexity: O(n) average for evenly spread keys, O(n²) worst case
+    Space Complexity: O(n)
+    Stability: Stable
+
+    The span between the smallest and largest value is split into up to n
+    equal-width buckets. Elements are dealt into their bucket, the buckets
+    are written back in order, and each bucket's (usually tiny) range is
+    finished with insertion sort. Buckets that hold a single repeated key
+    cost one comparison per element.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    element read and write, and each comparison in the insertion sorts
+    (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    lowest, highest = yield from key_range(array)
+    span = highest - lowest + 1
+    count = min(n, span)
+    buckets = [[] for _ in range(count)]
+    yield ALLOC, n + count, NO_INDEX
+
+    for i in range(n):
+        buckets[(array[i] - lowest) * count // span].append(array[i])
+        yield READ, i, NO_INDEX
+
+    bounds = []
+    k = 0
+    for bucket in buckets:
+        start = k
+        for value in bucket:
+            array[k] = value
+            yield WRITE, k, NO_INDEX
+            k += 1
+        if k - start > 1:
+            bounds.append((start, k - 1))
+
+    yield ALLOC, -(n + count), NO_INDEX
+
+    for low, high in bounds:
+        yield from insertion_sort_range(array, low, high)
+
+
+ALGORITHMS = {
+    "Bucket Sort": {
+        "entry": bucket_sort,
+        "description": "Deals elements into equal-width value ranges, then\ninsertion sorts each range. Linear for evenly spread keys.",
+        "time_complexity": "O(n) avg, O(n²) worst",
+        "space_complexity": "O(n)",
+        "stability": "Stable",
+        "best_case": "O(n) - evenly spread keys",
+    },
+}
@@ -0,0 +1,97 @@
+"""
+Sort Counters
+=============
+Operation counters shared between a sort's driver and whoever displays them.
+
+A driver feeds every step event to ``SortCounters.record``, which only
+bumps a few integer slots. Nothing is formatted or scheduled per step: a
+display (the GUI's render scheduler, a race pane) samples the object when
+it draws a frame, and a reader on another thread simply sees the latest
+values.
+"""
+
+from typing import Dict, Tuple
+
+from events import ALLOC, COMPARE, NO_INDEX, PIVOT, READ, SWAP, TALLY, WRITE
+
+
+class SortCounters:
+    """
+    Counts of the operations a sort has performed so far.
+
+    Reads and writes are the element accesses implied by the events: a
+    comparison reads two elements, a swap reads and writes two, a write
+    stores one (reading its source if it came from the array), and a READ
+    reads one into auxiliary storage.
+
+    Attributes:
+        comparisons (int): COMPARE and PIVOT events
+        swaps (int): SWAP and WRITE events (the "swaps" shown in the GUI)
+        writes (int): Array elements written
+        reads (int): Array elements read
+        aux (int): Auxiliary elements currently allocated
+        aux_peak (int): Peak of aux
+        allocations (int): Auxiliary allocations (ALLOC events with a > 0)
+
+    A TALLY event adds its comparisons (two reads each) and writes in bulk.
+    """
+
+    __slots__ = ('comparisons', 'swaps', 'writes', 'reads',
+                 'aux', 'aux_peak', 'allocations')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.reads = 0
+        self.aux = 0
+        self.aux_peak = 0
+        self.allocations = 0
+
+    def record(self, op: int, a: int, b: int) -> None:
+        """
+        Count one step event.
+
+        Args:
+            op: Event opcode (see events.py)
+            a: First index, the element count for ALLOC, or the
+               comparison count for TALLY
+            b: Second index, NO_INDEX, or the write count for TALLY
+        """
+        if op == COMPARE or op == PIVOT:
+            self.comparisons += 1
+            self.reads += 1 if b == NO_INDEX else 2
+        elif op == SWAP:
+            self.swaps += 1
+            self.reads += 2
+            self.writes += 2
+        elif op == WRITE:
+            self.swaps += 1
+            self.writes += 1
+            if b != NO_INDEX:
+                self.reads += 1
+        elif op == READ:
+            self.reads += 1
+        elif op == TALLY:
+            self.comparisons += a
+            self.reads += 2 * a
+            self.swaps += b
+            self.writes += b
+        elif op == ALLOC:
+            self.aux += a
+            if a > 0:
+                self.allocations += 1
+                if self.aux > self.aux_peak:
+                    self.aux_peak = self.aux
+
+    def snapshot(self) -> Tuple[int, int, int]:
+        """Return (comparisons, swaps, aux_peak), the statistics the GUI shows."""
+        return self.comparisons, self.swaps, self.aux_peak
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return every counter by name."""
+        return {name: getattr(self, name) for name in self.__slots__}
@@ -0,0 +1,81 @@
+"""
+Counting Sort Algorithm
+Distribution sort for small integer key ranges
+"""
+
+from events import ALLOC, NO_INDEX, READ, WRITE
+
+
+def counting_sort(array):
+    """
+    Counting Sort: Counts each key, then places elements by prefix sums.
+    Time Complexity: O(n + k) for k possible keys
+    Space Complexity: O(n + k)
+    Stability: Stable
+
+    No element is compared with another. One pass counts the occurrences
+    of every key between the smallest and largest value, the prefix sums
+    of the counts give each key's final position, and a pass from the
+    right moves every element to its position in an output buffer, which
+    is then copied back. Integer keys only.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    element read and write (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    lowest, highest = yield from key_range(array)
+    counts = [0] * (highest - lowest + 1)
+    yield ALLOC, len(counts), NO_INDEX
+
+    for i in range(n):
+        counts[array[i] - lowest] += 1
+        yield READ, i, NO_INDEX
+
+    # counts[key] becomes the end of that key's slots in the output
+    total = 0
+    for key, count in enumerate(counts):
+        total += count
+        counts[key] = total
+
+    output = [None] * n
+    yield ALLOC, n, NO_INDEX
+    for i in range(n - 1, -1, -1):
+        key = array[i] - lowest
+        counts[key] -= 1
+        output[counts[key]] = array[i]
+        yield READ, i, NO_INDEX
+
+    for i in range(n):
+        array[i] = output[i]
+        yield WRITE, i, NO_INDEX
+
+    yield ALLOC, -(n + len(counts)), NO_INDEX
+
+
+def key_range(array):
+    """Yield a READ per element and return the (smallest, largest) value."""
+    lowest = highest = array[0]
+    yield READ, 0, NO_INDEX
+    for i in range(1, len(array)):
+        value = array[i]
+        if value < lowest:
+            lowest = value
+        elif value > highest:
+            highest = value
+        yield READ, i, NO_INDEX
+    return lowest, highest
+
+
+ALGORITHMS = {
+    "Counting Sort": {
+        "entry": counting_sort,
+        "description": "Counts every key and places elements by prefix sums.\nNo comparisons; linear when the key range is small.",
+        "time_complexity": "O(n + k)",
+        "space_complexity": "O(n + k)",
+        "stability": "Stable",
+        "best_case": "O(n + k) - always same",
+    },
+}
@@ -0,0 +1,79 @@
+"""
+Step Events
+===========
+The protocol between sorting algorithms and whatever drives them.
+
+Every algorithm is a generator that sorts its array in place and yields a
+lightweight ``(op, a, b)`` tuple of ints after each step:
+
+- COMPARE (a, b): a and b were compared (b is NO_INDEX for a single bar)
+- PIVOT (a, b): a was compared against the pivot at b
+- SWAP (a, b): a and b were swapped
+- WRITE (a, b): array[a] was written, moving the value from index b
+  (NO_INDEX when it came from outside the array)
+- MARK (a, b): a (and b, unless NO_INDEX) is highlighted without a
+  comparison or a change
+- READ (a, b): array[a] was read into auxiliary storage, such as a
+  count table or a bucket; b is unused (NO_INDEX)
+- ALLOC (a, b): a auxiliary elements were allocated (negative when
+  freed); b is unused. Drivers track the peak and draw nothing
+- TALLY (a, b): a comparisons and b writes were made where the driver
+  can't see them, e.g. in worker processes. Counted, never drawn
+
+The driver (GUI, benchmark or trace recorder) decides how to throttle,
+batch or ignore the events, and stops the sort by simply no longer
+iterating. COMPARE and PIVOT count as comparisons; SWAP and WRITE count
+as swaps. Distribution sorts (counting, radix, bucket) place elements by
+key rather than by comparing them, so they mostly yield READ and WRITE.
+
+Traces (see sort_trace.py) reuse these opcodes for their records, except
+that a trace WRITE stores the value delta in b instead of a source index.
+"""
+
+from typing import List, Tuple
+
+COMPARE = 0
+PIVOT = 1
+SWAP = 2
+WRITE = 3
+MARK = 4
+ALLOC = 5
+READ = 6
+TALLY = 7
+
+NO_INDEX = -1
+
+# Opcodes counted as comparisons and as swaps in the statistics
+COMPARISON_OPS = (COMPARE, PIVOT)
+SWAP_OPS = (SWAP, WRITE)
+
+# Opcodes that only update the statistics and are never drawn
+SILENT_OPS = (ALLOC, TALLY)
+
+# Color keys used by the visualizer for each opcode, per index
+EVENT_COLORS = {
+    COMPARE: ('comparing', 'comparing'),
+    PIVOT: ('comparing', 'pivot'),
+    SWAP: ('swapping', 'swapping'),
+    WRITE: ('swapping', 'swapping'),
+    MARK: ('comparing', 'comparing'),
+    READ: ('pivot', 'pivot'),
+}
+
+
+def event_highlight(op: int, a: int, b: int) -> Tuple[List[int], List[str]]:
+    """
+    Return the (indices, colors) to draw for a step event.
+
+    Args:
+        op: Event opcode
+        a: First index
+        b: Second index or NO_INDEX
+
+    Returns:
+        Lists of indices and matching color keys for draw_array
+    """
+    colors = EVENT_COLORS[op]
+    if b == NO_INDEX:
+        return [a], [colors[0]]
+    return [a, b], list(colors)
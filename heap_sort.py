@@ -0,0 +1,146 @@
+"""
+Heap Sort Algorithm
+Array-backed binary max-heap, with classic and bottom-up sift-down
+"""
+
+from events import COMPARE, NO_INDEX, SWAP, WRITE
+
+
+def heap_sort(array):
+    """
+    Heap Sort: Builds a max-heap in the array, then repeatedly extracts the max.
+    Time Complexity: O(n log n)
+    Space Complexity: O(1)
+    Stability: Unstable
+
+    The heap lives in the array itself (the children of node i are at
+    2i + 1 and 2i + 2), so no auxiliary memory is used at all. Each
+    extraction swaps the root with the last heap element and sifts the
+    new root down, comparing both children at every level.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and swap (see events.py).
+    """
+    yield from heap_sort_range(array, 0, len(array) - 1)
+
+
+def heap_sort_bottom_up(array):
+    """
+    Bottom-Up Heap Sort: Heap sort with Wegener's bottom-up sift-down.
+    Time Complexity: O(n log n)
+    Space Complexity: O(1)
+    Stability: Unstable
+
+    The element sifted down after an extraction came from the bottom of
+    the heap, so it almost always sinks back to near the bottom. Instead
+    of comparing it at every level, the sift follows the path of larger
+    children to a leaf (one comparison per level), climbs back up to the
+    element's place (usually only a step or two) and shifts the path up
+    by one. This roughly halves the comparisons of the classic version.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison, swap and write (see events.py).
+    """
+    yield from heap_sort_range(array, 0, len(array) - 1, sift_down_bottom_up)
+
+
+def heap_sort_range(array, low, high, sift=None):
+    """
+    Heapsort array[low:high + 1] in place, yielding step events.
+
+    Args:
+        array: List to sort in place
+        low: First index of the range
+        high: Last index of the range
+        sift: Sift-down generator, sift_down (default) or sift_down_bottom_up
+    """
+    sift = sift or sift_down
+    size = high - low + 1
+
+    for root in range(size // 2 - 1, -1, -1):
+        yield from sift(array, low, root, size)
+
+    for end in range(size - 1, 0, -1):
+        array[low], array[low + end] = array[low + end], array[low]
+        yield SWAP, low, low + end
+        yield from sift(array, low, 0, end)
+
+
+def sift_down(array, base, root, size):
+    """
+    Restore the max-heap property below root.
+
+    The heap is array[base:base + size], with the children of node i at
+    2i + 1 and 2i + 2 (relative to base).
+    """
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size:
+            yield COMPARE, base + child, base + child + 1
+            if array[base + child] < array[base + child + 1]:
+                child += 1
+        yield COMPARE, base + root, base + child
+        if not array[base + root] < array[base + child]:
+            return
+        array[base + root], array[base + child] = array[base + child], array[base + root]
+        yield SWAP, base + root, base + child
+        root = child
+
+
+def sift_down_bottom_up(array, base, root, size):
+    """
+    Restore the max-heap property below root, leaf first.
+
+    Same heap layout as sift_down.
+    """
+    # Follow the larger children down to a leaf
+    leaf = root
+    while 2 * leaf + 2 < size:
+        child = 2 * leaf + 1
+        yield COMPARE, base + child, base + child + 1
+        if array[base + child] < array[base + child + 1]:
+            child += 1
+        leaf = child
+    if 2 * leaf + 1 < size:
+        leaf = 2 * leaf + 1
+
+    # Climb back to the first node on the path not smaller than the root
+    value = array[base + root]
+    while leaf > root:
+        yield COMPARE, base + root, base + leaf
+        if not value > array[base + leaf]:
+            break
+        leaf = (leaf - 1) // 2
+    if leaf == root:
+        return
+
+    # Put the root's value there and shift the path above it up one level
+    carried = array[base + leaf]
+    array[base + leaf] = value
+    yield WRITE, base + leaf, base + root
+    while leaf > root:
+        leaf = (leaf - 1) // 2
+        array[base + leaf], carried = carried, array[base + leaf]
+        yield WRITE, base + leaf, NO_INDEX
+
+
+ALGORITHMS = {
+    "Heap Sort": {
+        "entry": heap_sort,
+        "description": "Builds a max-heap inside the array and repeatedly moves\nthe max to the end. O(n log n) worst case, O(1) memory.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(1)",
+        "stability": "Unstable",
+        "best_case": "O(n log n) - always same",
+    },
+    "Heap Sort (Bottom-Up)": {
+        "entry": heap_sort_bottom_up,
+        "description": "Heap sort whose sift-down runs to a leaf and climbs back,\nabout half the comparisons of the classic version.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(1)",
+        "stability": "Unstable",
+        "best_case": "O(n log n) - always same",
+    },
+}
@@ -0,0 +1,146 @@
+"""
+Image Renderer
+==============
+Pixel-buffer rendering backend for arrays too large for one canvas item per bar.
+
+The retained-mode canvas backend creates a rectangle per element, which
+stops scaling somewhere in the low thousands: a 1180px canvas cannot show
+more bars than it has pixel columns anyway, and Tk pays for every item.
+This backend rasterizes the bars into a single ``tk.PhotoImage`` instead.
+
+Elements are assigned to pixel columns; when several elements share a
+column it is drawn as a solid bar up to the column's minimum value with a
+lighter band from the minimum to the maximum, so the shape of the data
+(and any disorder inside the column) stays visible at any size. A column
+takes the color of its most prominent highlight state. Each frame only
+repaints the columns containing indices that changed.
+"""
+
+import tkinter as tk
+from typing import Iterable
+
+from array_model import MARGIN, ArrayModel
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Share of the background mixed into a column's color for its min..max band
+BAND_BLEND = 0.5
+
+
+def _blend(color: str, other: str, t: float) -> str:
+    """
+    Mix two '#rrggbb' colors.
+
+    Args:
+        color: Base color
+        other: Color mixed in
+        t: Share of other in the result, from 0 to 1
+
+    Returns:
+        The mixed color as '#rrggbb'
+    """
+    a = [int(color[k:k + 2], 16) for k in (1, 3, 5)]
+    b = [int(other[k:k + 2], 16) for k in (1, 3, 5)]
+    return '#' + ''.join(f'{round(x + (y - x) * t):02x}' for x, y in zip(a, b))
+
+
+class ImageRenderer:
+    """
+    Draw an array into a PhotoImage, one pixel column per group of elements.
+
+    Attributes:
+        model (ArrayModel): Values, max value and highlight states to draw
+        image (tk.PhotoImage): The pixel buffer shown on the canvas
+        columns (int): Number of pixel columns in use (at most one per element)
+    """
+
+    def __init__(self, canvas: tk.Canvas, model: ArrayModel,
+                 canvas_width: int, canvas_height: int, background: str,
+                 left: int = 0, top: int = 0):
+        """
+        Create the image and place it on the canvas.
+
+        Args:
+            canvas: Canvas to draw on
+            model: Model of the array to draw
+            canvas_width: Width of the drawing area in pixels
+            canvas_height: Height of the drawing area in pixels
+            background: Canvas background color ('#rrggbb')
+            left: x of the drawing area's left edge on the canvas
+            top: y of the drawing area's top edge on the canvas
+        """
+        self.model = model
+        self.background = background
+        self.width = max(canvas_width - 2 * MARGIN, 1)
+        self.height = max(canvas_height - 40, 1)
+        self.image = tk.PhotoImage(width=self.width, height=self.height)
+        canvas.create_image(left + MARGIN, top + 20, anchor='nw', image=self.image)
+
+        n = len(model.values)
+        self.columns = min(n, self.width)
+        # Column c holds elements [starts[c], starts[c + 1]) and pixels [xs[c], xs[c + 1])
+        self._starts = [-(-c * n // self.columns) for c in range(self.columns + 1)]
+        self._xs = [c * self.width // self.columns for c in range(self.columns + 1)]
+        self._scale = self.height / model.max_value
+        self._bands = [_blend(color, background, BAND_BLEND) for color in model.palette]
+
+    def column_of(self, i: int) -> int:
+        """Return the pixel column that element i is drawn in."""
+        return i * self.columns // len(self.model.values)
+
+    def draw_all(self) -> None:
+        """Repaint every column."""
+        values = self.model.values
+        starts = self._starts[:-1]
+        if np is not None and len(values) > self.columns:
+            data = np.asarray(values)
+            lows = np.minimum.reduceat(data, starts).tolist()
+            highs = np.maximum.reduceat(data, starts).tolist()
+            codes = np.maximum.reduceat(self.model.state, starts).tolist()
+            for c in range(self.columns):
+                self._paint_column(c, lows[c], highs[c], codes[c])
+        else:
+            for c in range(self.columns):
+                self._draw_column(c)
+
+    def update(self, indices: Iterable[int]) -> None:
+        """
+        Repaint the columns containing the given element indices.
+
+        Args:
+            indices: Elements whose value or highlight state changed
+        """
+        n = len(self.model.values)
+        columns = self.columns
+        for c in {i * columns // n for i in indices}:
+            self._draw_column(c)
+
+    def _draw_column(self, c: int) -> None:
+        """Recompute the min, max and state of column c and paint it."""
+        start, end = self._starts[c], self._starts[c + 1]
+        values = self.model.values[start:end]
+        self._paint_column(c, min(values), max(values), max(self.model.state[start:end]))
+
+    def _paint_column(self, c: int, low: int, high: int, code: int) -> None:
+        """
+        Paint one column.
+
+        Args:
+            c: Column index
+            low: Smallest value in the column
+            high: Largest value in the column
+            code: Highlight state code for the column's color
+        """
+        x1, x2 = self._xs[c], self._xs[c + 1]
+        low_top = self.height - round(low * self._scale)
+        high_top = self.height - round(high * self._scale)
+        put = self.image.put
+        if high_top > 0:
+            put(self.background, to=(x1, 0, x2, high_top))
+        if low_top > high_top:
+            put(self._bands[code], to=(x1, high_top, x2, low_top))
+        if low_top < self.height:
+            put(self.model.palette[code], to=(x1, low_top, x2, self.height))
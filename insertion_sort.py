@@ -3,39 +3,50 @@ Insertion Sort Algorithm
 Team Member: Yousef Naser
 """
 
-import time
+from events import COMPARE, MARK, NO_INDEX, WRITE
 
-def insertion_sort(array, draw_data, delay_func, is_sorting_func, update_stats_func):
+
+def insertion_sort(array):
     """
     Insertion Sort: Builds sorted array one element at a time.
     Time Complexity: O(n²)
     Space Complexity: O(1)
     Stability: Stable
-    """
-    comparisons = 0
-    swaps = 0
     
-    for i in range(1, len(array)):
-        if not is_sorting_func(): 
-            return
-        
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and write (see events.py).
+    """
+    yield from insertion_sort_range(array, 0, len(array) - 1)
+
+
+def insertion_sort_range(array, low, high):
+    """Insertion sort array[low:high + 1] in place, yielding step events."""
+    for i in range(low + 1, high + 1):
         key = array[i]
         j = i - 1
         
-        draw_data([i], ['comparing'])
-        time.sleep(delay_func())
+        yield MARK, i, NO_INDEX
         
-        while j >= 0 and array[j] > key:
-            if not is_sorting_func(): 
-                return
-            comparisons += 1
+        while j >= low:
+            yield COMPARE, j, j + 1
+            if array[j] <= key:
+                break
             array[j + 1] = array[j]
-            swaps += 1
-            
-            draw_data([j, j + 1], ['swapping', 'swapping'])
-            update_stats_func(comparisons, swaps)
-            time.sleep(delay_func())
+            yield WRITE, j + 1, j
             j -= 1
             
-        if is_sorting_func():
+        if j + 1 != i:
             array[j + 1] = key
+            yield WRITE, j + 1, NO_INDEX
+
+
+ALGORITHMS = {
+    "Insertion Sort": {
+        "entry": insertion_sort,
+        "description": "Builds sorted array one element at a time.\nEfficient for small or nearly sorted datasets.",
+        "time_complexity": "O(n²)",
+        "space_complexity": "O(1)",
+        "stability": "Stable",
+        "best_case": "O(n) - when nearly sorted",
+    },
+}
@@ -0,0 +1,72 @@
+"""
+Intro Sort Algorithm
+Quick sort with a heapsort fallback and insertion sort for small slices
+"""
+
+from events import SWAP
+from heap_sort import heap_sort_range
+from insertion_sort import insertion_sort_range
+from quick_sort import choose_pivot, partition
+
+# Slices this short are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+
+def intro_sort(array):
+    """
+    Intro Sort: Quick sort that switches to heapsort when it degrades.
+    Time Complexity: O(n log n)
+    Space Complexity: O(log n)
+    Stability: Unstable
+
+    Partitions like the iterative quick sort (median-of-three/ninther
+    pivots, smaller side first) but gives every range a depth budget of
+    2 * log2(n) partitions. A range that exhausts it, i.e. one on which
+    the pivots keep coming out badly unbalanced, is heapsorted instead,
+    which bounds the worst case at O(n log n). Ranges of at most
+    INSERTION_THRESHOLD elements are finished with insertion sort.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and swap (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    stack = [(0, n - 1, 2 * (n.bit_length() - 1))]
+
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > INSERTION_THRESHOLD:
+            if depth == 0:
+                yield from heap_sort_range(array, low, high)
+                break
+            depth -= 1
+
+            p = yield from choose_pivot(array, low, high)
+            if p != high:
+                array[p], array[high] = array[high], array[p]
+                yield SWAP, p, high
+
+            pi = yield from partition(array, low, high)
+
+            if pi - low < high - pi:
+                stack.append((pi + 1, high, depth))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1, depth))
+                low = pi + 1
+        else:
+            yield from insertion_sort_range(array, low, high)
+
+
+ALGORITHMS = {
+    "Intro Sort": {
+        "entry": intro_sort,
+        "description": "Quick sort with a recursion depth limit: degenerate ranges\nare heapsorted, small ones insertion sorted.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(log n)",
+        "stability": "Unstable",
+        "best_case": "O(n log n) - balanced partitions",
+    },
+}
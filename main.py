@@ -9,10 +9,14 @@ algorithms with real-time visualization.
 
 Features:
 ---------
-- 5 sorting algorithms: Bubble, Selection, Insertion, Merge, Quick Sort
+- 19 sorting algorithms: Bubble, Selection, Insertion, Merge (recursive,
+  bottom-up, preallocated, parallel, in-place block), Quick (recursive,
+  iterative, 3-way), Tim, Intro, Heap (classic, bottom-up), Counting,
+  Radix (LSD, MSD) and Bucket Sort
 - Real-time visualization with color-coded operations
 - Performance statistics (comparisons, swaps, time)
-- Multiple array patterns (Random, Nearly Sorted, Reversed, Few Unique)
+- Multiple array patterns (Random, Nearly Sorted, Reversed, Few Unique,
+  Sawtooth, Organ Pipe, Zipf Duplicates, Sorted Runs, Quicksort Killer)
 - Dark/Light theme support
 - Keyboard shortcuts for quick control
 
@@ -22,7 +26,7 @@ Usage:
 
 Requirements:
 -------------
-- Python 3.6+
+- Python 3.9+
 - tkinter (usually included with Python)
 
 Authors:
@@ -39,6 +43,7 @@ Version: 2.0.0
 
 import sys
 import os
+import multiprocessing
 
 # Add current directory to path so imports work correctly
 # This ensures the module can find the sorting algorithm files
@@ -61,6 +66,11 @@ def main() -> None:
     print("  [G]     - Generate new array")
     print("  [T]     - Toggle theme (dark/light)")
     print("  [Esc]   - Stop sorting")
+    print("  [P]     - Pause/resume (live sort or playback)")
+    print("  [←/→]   - Step one operation backward/forward")
+    print("  [Shift+←/→] - Run 100 operations backward/forward")
+    print("  [Home]  - Rewind playback")
+    print("  [O]     - Toggle profiler overlay")
     print("=" * 50)
     
     app = SortingVisualizer()
@@ -68,4 +78,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Lets a frozen executable act as a parallel merge sort worker
+    multiprocessing.freeze_support()
     main()
@@ -3,68 +3,175 @@ Merge Sort Algorithm
 Team Member: Ahmed Hassan
 """
 
-import time
+from events import ALLOC, COMPARE, NO_INDEX, WRITE
 
-def merge_sort(array, draw_data, delay_func, is_sorting_func, update_stats_func):
+
+def merge_sort(array):
     """
     Merge Sort: Divide and conquer algorithm that merges sorted subarrays.
     Time Complexity: O(n log n)
     Space Complexity: O(n)
     Stability: Stable
+    
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and write (see events.py).
+    """
+    def merge_sort_recursive(left, right):
+        if left < right:
+            mid = (left + right) // 2
+            
+            yield from merge_sort_recursive(left, mid)
+            yield from merge_sort_recursive(mid + 1, right)
+            yield from merge(array, left, mid, right)
+
+    yield from merge_sort_recursive(0, len(array) - 1)
+
+
+def merge_sort_bottom_up(array):
+    """
+    Bottom-Up Merge Sort: Merges runs of width 1, 2, 4, ... without recursion.
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+    Stability: Stable
+    
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and write (see events.py).
+    """
+    n = len(array)
+    width = 1
+    
+    while width < n:
+        for left in range(0, n - width, 2 * width):
+            mid = left + width - 1
+            right = min(left + 2 * width - 1, n - 1)
+            yield from merge(array, left, mid, right)
+        width *= 2
+
+
+def merge_sort_preallocated(array):
+    """
+    Preallocated Merge Sort: Top-down merge sort with one auxiliary buffer.
+    Time Complexity: O(n log n)
+    Space Complexity: O(n) - a single buffer of ceil(n/2) elements
+    Stability: Stable
+    
+    The buffer is allocated once up front; each merge copies its left run
+    into it and merges back into the array, so no merge allocates.
+    
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and write (see events.py).
     """
-    comparisons = 0
-    swaps = 0
+    buffer = [0] * ((len(array) + 1) // 2)
+    yield ALLOC, len(buffer), NO_INDEX
     
-    def merge_sort_recursive(left, right, comps, swps):
-        if left < right and is_sorting_func():
+    def merge_sort_recursive(left, right):
+        if left < right:
             mid = (left + right) // 2
             
-            c1, s1 = merge_sort_recursive(left, mid, comps, swps)
-            c2, s2 = merge_sort_recursive(mid + 1, right, c1, s1)
-            return merge(left, mid, right, c2, s2)
-        return comps, swps
+            yield from merge_sort_recursive(left, mid)
+            yield from merge_sort_recursive(mid + 1, right)
+            yield from merge_buffered(array, buffer, left, mid, right)
 
-    def merge(left, mid, right, comps, swps):
-        if not is_sorting_func(): 
-            return comps, swps
-        
-        left_arr = array[left:mid + 1]
-        right_arr = array[mid + 1:right + 1]
+    yield from merge_sort_recursive(0, len(array) - 1)
+    yield ALLOC, -len(buffer), NO_INDEX
+
+
+def merge_buffered(array, buffer, left, mid, right):
+    """
+    Merge array[left:mid + 1] and array[mid + 1:right + 1] without allocating.
+    
+    The left run is copied into buffer (which must hold at least
+    mid - left + 1 elements); the right run is merged from its place.
+    """
+    size = mid - left + 1
+    for t in range(size):
+        buffer[t] = array[left + t]
+    
+    i = 0
+    j = mid + 1
+    k = left
+    
+    while i < size and j <= right:
+        yield COMPARE, k, j
         
-        i = j = 0
-        k = left
+        if buffer[i] <= array[j]:
+            array[k] = buffer[i]
+            i += 1
+        else:
+            array[k] = array[j]
+            j += 1
         
-        while i < len(left_arr) and j < len(right_arr) and is_sorting_func():
-            comps += 1
-            
-            draw_data([k], ['comparing'])
-            update_stats_func(comps, swps)
-            time.sleep(delay_func())
-            
-            if left_arr[i] <= right_arr[j]:
-                array[k] = left_arr[i]
-                i += 1
-            else:
-                array[k] = right_arr[j]
-                j += 1
-            
-            swps += 1
-            k += 1
+        yield WRITE, k, NO_INDEX
+        k += 1
+    
+    # Whatever is left of the right run is already in place
+    while i < size:
+        array[k] = buffer[i]
+        yield WRITE, k, NO_INDEX
+        i += 1
+        k += 1
+
+
+def merge(array, left, mid, right):
+    """Merge the sorted runs array[left:mid + 1] and array[mid + 1:right + 1]."""
+    left_arr = array[left:mid + 1]
+    right_arr = array[mid + 1:right + 1]
+    yield ALLOC, right - left + 1, NO_INDEX
+    
+    i = j = 0
+    k = left
+    
+    while i < len(left_arr) and j < len(right_arr):
+        yield COMPARE, k, NO_INDEX
         
-        while i < len(left_arr) and is_sorting_func():
+        if left_arr[i] <= right_arr[j]:
             array[k] = left_arr[i]
             i += 1
-            k += 1
-            swps += 1
-            time.sleep(delay_func())
-            
-        while j < len(right_arr) and is_sorting_func():
+        else:
             array[k] = right_arr[j]
             j += 1
-            k += 1
-            swps += 1
-            time.sleep(delay_func())
-            
-        return comps, swps
+        
+        yield WRITE, k, NO_INDEX
+        k += 1
+    
+    while i < len(left_arr):
+        array[k] = left_arr[i]
+        yield WRITE, k, NO_INDEX
+        i += 1
+        k += 1
+        
+    while j < len(right_arr):
+        array[k] = right_arr[j]
+        yield WRITE, k, NO_INDEX
+        j += 1
+        k += 1
+    
+    yield ALLOC, -(right - left + 1), NO_INDEX
+
 
-    merge_sort_recursive(0, len(array) - 1, comparisons, swaps)
+ALGORITHMS = {
+    "Merge Sort": {
+        "entry": merge_sort,
+        "description": "Divide and conquer algorithm that merges sorted subarrays.\nConsistent O(n log n) performance.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(n)",
+        "stability": "Stable",
+        "best_case": "O(n log n) - always same",
+    },
+    "Merge Sort (Bottom-Up)": {
+        "entry": merge_sort_bottom_up,
+        "description": "Iterative merge sort that merges runs of doubling width.\nNo recursion, so it scales to very large arrays.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(n)",
+        "stability": "Stable",
+        "best_case": "O(n log n) - always same",
+    },
+    "Merge Sort (Preallocated)": {
+        "entry": merge_sort_preallocated,
+        "description": "Top-down merge sort with one buffer allocated up front.\nMerges copy the left run into it - no per-merge slices.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(n) - n/2 buffer",
+        "stability": "Stable",
+        "best_case": "O(n log n) - always same",
+    },
+}
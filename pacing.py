@@ -0,0 +1,148 @@
+"""
+Pacing Controller
+=================
+Throttling for a sort running live in a worker thread.
+
+The sort thread calls ``wait()`` after every step. The call sleeps for the
+current step delay on a condition variable rather than ``time.sleep``, so
+the main thread can interrupt it at any moment: stopping wakes it so it
+can exit immediately, a speed change restarts the wait with the new delay,
+and while paused it blocks without using any CPU until it is resumed or
+granted steps.
+"""
+
+import threading
+import time
+from typing import Tuple
+
+
+def pace_for_rate(ops_per_second: float, fps: int = 60) -> Tuple[float, int]:
+    """
+    Split a target operation rate into a step delay and a batch size.
+
+    Rates up to fps run one operation per step. Faster rates would need
+    delays below the frame interval (and eventually below the OS sleep
+    granularity), so they keep one step per frame and run several
+    operations per step instead.
+
+    Args:
+        ops_per_second: Target operations per second
+        fps: Frames presented per second
+
+    Returns:
+        (delay between steps in seconds, operations per step)
+    """
+    if ops_per_second <= fps:
+        return 1 / ops_per_second, 1
+    return 1 / fps, round(ops_per_second / fps)
+
+
+class PacingController:
+    """
+    Pause, resume, single-step and throttle a worker thread.
+
+    wait() is called from the worker thread; every other method is called
+    from the controlling (GUI) thread.
+
+    Attributes:
+        delay (float): Time between steps in seconds
+        paused (bool): Whether the worker only proceeds on granted steps
+        stopped (bool): Whether the worker should stop
+    """
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Initialize the controller.
+
+        Args:
+            delay: Time between steps in seconds
+        """
+        self._cond = threading.Condition()
+        self.delay = delay
+        self.paused = False
+        self.stopped = False
+        self._permits = 0
+        self._last_step = time.monotonic()
+
+    def reset(self) -> None:
+        """Prepare for a new run: not paused, not stopped, no pending steps."""
+        with self._cond:
+            self.paused = False
+            self.stopped = False
+            self._permits = 0
+            self._last_step = time.monotonic()
+
+    # ==================== WORKER SIDE ====================
+
+    def wait(self) -> bool:
+        """
+        Block until the worker may perform its next step.
+
+        The delay is measured from the previous step, so time the worker
+        spends between calls counts towards it.
+
+        Returns:
+            False if the worker should stop, True to continue
+        """
+        with self._cond:
+            while not self.stopped:
+                if self.paused:
+                    if self._permits:
+                        self._permits -= 1
+                        self._last_step = time.monotonic()
+                        return True
+                    self._cond.wait()
+                    continue
+                # Recomputed on every wake-up so speed changes apply at once
+                now = time.monotonic()
+                remaining = self._last_step + self.delay - now
+                if remaining <= 0:
+                    # Don't let a long pause or a slow step cause a burst
+                    self._last_step = max(self._last_step + self.delay, now - self.delay)
+                    return True
+                self._cond.wait(remaining)
+            return False
+
+    # ==================== CONTROL SIDE ====================
+
+    def set_delay(self, delay: float) -> None:
+        """
+        Change the time between steps, waking a waiting worker.
+
+        Args:
+            delay: Time between steps in seconds
+        """
+        with self._cond:
+            self.delay = delay
+            self._cond.notify_all()
+
+    def pause(self) -> None:
+        """Stop the worker at its next step until resumed or stepped."""
+        with self._cond:
+            self.paused = True
+            self._permits = 0
+
+    def resume(self) -> None:
+        """Let the worker run at the normal pace again."""
+        with self._cond:
+            self.paused = False
+            self._permits = 0
+            self._cond.notify_all()
+
+    def step(self, count: int = 1) -> None:
+        """
+        Pause and allow the worker exactly count more steps.
+
+        Args:
+            count: Number of steps to run before blocking again
+        """
+        with self._cond:
+            self.paused = True
+            self._permits += count
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Tell the worker to stop, waking it if it is waiting."""
+        with self._cond:
+            self.stopped = True
+            self._cond.notify_all()
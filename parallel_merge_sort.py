@@ -0,0 +1,289 @@
+"""
+Parallel Merge Sort Algorithm
+Chunks merge sorted by a process pool in shared memory, then heap merged
+"""
+
+import multiprocessing
+import os
+from array import array as int_array
+from multiprocessing import shared_memory
+
+from counters import SortCounters
+from events import ALLOC, COMPARE, NO_INDEX, TALLY, WRITE
+from merge_sort import merge_sort_preallocated
+
+# Element type of the shared buffer (signed 64-bit integers)
+TYPECODE = 'q'
+
+# Chunks are never made shorter than this
+MIN_CHUNK_SIZE = 256
+
+# Worker processes when the caller gives none (None: one per CPU)
+DEFAULT_WORKERS = None
+
+# Seconds between looks at the workers' progress
+POLL_INTERVAL = 0.02
+
+# Step events a worker runs between two updates of its progress slots
+PUBLISH_EVENTS = 1 << 12
+
+# Progress slots per worker: comparisons, writes, first and last index
+# written since the parent last mirrored the chunk, writes the parent has
+# mirrored up to
+PROGRESS_SLOTS = 5
+
+
+def parallel_merge_sort(array, workers=None):
+    """
+    Parallel Merge Sort: Chunks sorted concurrently by worker processes, then merged.
+    Time Complexity: O(n log n), O((n/p) log(n/p) + n log p) wall time on p cores
+    Space Complexity: O(n)
+    Stability: Stable
+
+    The array is copied once into a shared memory buffer of 64-bit ints
+    and split into one chunk per worker. Each worker attaches to the
+    buffer and runs the preallocated merge sort on its chunk in place, so
+    no element is ever pickled; it publishes its comparison and write
+    counts, and the range of indices it has written, in a second shared
+    block as it goes. The chunks are finally combined by a k-way merge
+    through a binary heap of chunk heads. An array that makes a single
+    chunk (fewer than 2 * MIN_CHUNK_SIZE elements, or one worker) is
+    sorted in-process by the preallocated merge sort instead.
+
+    While the workers run, the written ranges are mirrored into the array
+    every POLL_INTERVAL seconds: every element in them that changed is
+    yielded as a WRITE, so all chunks can be seen being sorted at once,
+    and the rest of the workers' counts follow as TALLY events. A poll
+    only touches what was written since the previous one, not the whole
+    array. Integer values only. Closing the generator early terminates
+    the workers.
+
+    Without idle cores the workers only add cost: on a single CPU,
+    1,000,000 random ints took 14.7 s with four workers (17.4 s with two)
+    against 10.2 s for the preallocated merge sort. The wall time bound
+    above assumes a free core per worker; no multi-core run has been
+    measured.
+
+    Args:
+        array: List of ints to sort in place
+        workers: Worker processes (default: DEFAULT_WORKERS, or one per CPU)
+
+    Yields an (op, a, b) step event per mirrored or merged write, per heap
+    comparison, and per progress update (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    workers = workers or DEFAULT_WORKERS or os.cpu_count() or 1
+    chunks = max(1, min(workers, n // MIN_CHUNK_SIZE))
+    if chunks == 1:
+        yield from merge_sort_preallocated(array)
+        return
+    bounds = [(k * n // chunks, (k + 1) * n // chunks) for k in range(chunks)]
+
+    packed = int_array(TYPECODE, array)
+    data = shared_memory.SharedMemory(create=True, size=len(packed) * packed.itemsize)
+    progress = shared_memory.SharedMemory(
+        create=True, size=chunks * PROGRESS_SLOTS * packed.itemsize)
+    # The blocks may be rounded up to a whole page
+    view = data.buf.cast(TYPECODE)[:n]
+    counts = progress.buf.cast(TYPECODE)[:chunks * PROGRESS_SLOTS]
+    pool = None
+    completed = False
+    aux = n + sum((stop - start + 1) // 2 for start, stop in bounds)
+    yield ALLOC, aux, NO_INDEX
+
+    try:
+        view[:] = packed
+        del packed
+        for slot in range(len(counts)):
+            counts[slot] = 0
+
+        # Spawned rather than forked: the GUI runs sorts on a thread
+        pool = multiprocessing.get_context('spawn').Pool(chunks)
+        pending = {
+            k: pool.apply_async(_sort_chunk, (data.name, progress.name, k, start, stop))
+            for k, (start, stop) in enumerate(bounds)
+        }
+        reported = [[0, 0, 0] for _ in bounds]
+
+        while pending:
+            next(iter(pending.values())).wait(POLL_INTERVAL)
+            for k in [k for k, result in pending.items() if result.ready()]:
+                # Re-raises an exception from the worker
+                pending.pop(k).get()
+            for k, (start, stop) in enumerate(bounds):
+                yield from _mirror_chunk(array, view, counts, k, start, stop, reported[k])
+
+        yield from _merge_chunks(array, view, bounds)
+        completed = True
+    finally:
+        if pool is not None:
+            # On an error or a stop (generator closed) workers may still
+            # be sorting; kill them so none outlives the sort
+            if completed:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+        del view, counts
+        for block in (data, progress):
+            block.close()
+            block.unlink()
+
+    yield ALLOC, -aux, NO_INDEX
+
+
+def _sort_chunk(data_name, progress_name, k, start, stop):
+    """
+    Worker process: merge sort view[start:stop] of the shared buffer in place.
+
+    Publishes the running comparison and write counts into progress
+    slots k * PROGRESS_SLOTS and k * PROGRESS_SLOTS + 1, and the first and
+    last index written (relative to start) into the next two. The written
+    range grows until the parent acknowledges it by storing the write
+    count it has mirrored in the last slot, then starts afresh.
+    """
+    data = shared_memory.SharedMemory(name=data_name)
+    progress = shared_memory.SharedMemory(name=progress_name)
+    chunk = data.buf.cast(TYPECODE)[start:stop]
+    counts = progress.buf.cast(TYPECODE)[:(k + 1) * PROGRESS_SLOTS]
+    slot = k * PROGRESS_SLOTS
+    try:
+        counters = SortCounters()
+        record = counters.record
+        pending = 0
+        # Written range since the last publish, and as last published
+        low, high = stop - start, -1
+        published_low, published_high, published_writes = low, high, 0
+        for op, a, b in merge_sort_preallocated(chunk):
+            record(op, a, b)
+            if op == WRITE:
+                if a < low:
+                    low = a
+                if a > high:
+                    high = a
+            pending += 1
+            if pending == PUBLISH_EVENTS:
+                pending = 0
+                if counts[slot + 4] < published_writes:
+                    # The parent hasn't mirrored the last range yet
+                    low = min(low, published_low)
+                    high = max(high, published_high)
+                published_low, published_high = low, high
+                published_writes = counters.writes
+                counts[slot + 2] = low
+                counts[slot + 3] = high
+                counts[slot] = counters.comparisons
+                counts[slot + 1] = published_writes
+                low, high = stop - start, -1
+        if counts[slot + 4] < published_writes:
+            low = min(low, published_low)
+            high = max(high, published_high)
+        counts[slot + 2] = low
+        counts[slot + 3] = high
+        counts[slot] = counters.comparisons
+        counts[slot + 1] = counters.writes
+    finally:
+        chunk.release()
+        counts.release()
+        data.close()
+        progress.close()
+
+
+def _mirror_chunk(array, view, counts, k, start, stop, reported):
+    """
+    Copy chunk k's changes from the shared buffer into the array.
+
+    Only the range the worker has published as written is looked at.
+    Yields a WRITE per changed element and then a TALLY with the
+    comparisons and writes the worker made since the last call that the
+    WRITEs don't already account for. reported holds the [comparisons,
+    writes, writes mirrored] already yielded for this chunk and is
+    updated.
+    """
+    slot = k * PROGRESS_SLOTS
+    # Counts first: the worker stores the range before them, so the range
+    # read here covers at least the writes counted
+    comparisons = counts[slot]
+    writes = counts[slot + 1]
+    if comparisons == reported[0] and writes == reported[2]:
+        return
+    low = start + counts[slot + 2]
+    high = start + counts[slot + 3] + 1
+
+    current = view[low:high].tolist()
+    # Compare blocks at C speed; only blocks that differ are walked
+    block = 256
+    for offset in range(0, high - low, block):
+        if array[low + offset:low + offset + block] == current[offset:offset + block]:
+            continue
+        for i in range(low + offset, min(low + offset + block, high)):
+            value = current[i - low]
+            if array[i] != value:
+                array[i] = value
+                reported[1] += 1
+                yield WRITE, i, NO_INDEX
+    reported[2] = writes
+    counts[slot + 4] = writes
+
+    extra_comparisons = comparisons - reported[0]
+    extra_writes = max(writes - reported[1], 0)
+    if extra_comparisons or extra_writes:
+        reported[0] = comparisons
+        reported[1] += extra_writes
+        yield TALLY, extra_comparisons, extra_writes
+
+
+def _merge_chunks(array, view, bounds):
+    """K-way merge the sorted chunks of the shared buffer into the array."""
+    position = [start for start, _ in bounds]
+    # Heap of (head value, chunk); ties go to the earlier chunk (stable)
+    heap = [(view[start], k) for k, (start, stop) in enumerate(bounds) if start < stop]
+    for root in range(len(heap) // 2 - 1, -1, -1):
+        yield from _sift_down(heap, root, 0)
+
+    for dest in range(len(array)):
+        value, k = heap[0]
+        array[dest] = value
+        yield WRITE, dest, NO_INDEX
+
+        position[k] += 1
+        if position[k] < bounds[k][1]:
+            heap[0] = (view[position[k]], k)
+        else:
+            heap[0] = heap[-1]
+            heap.pop()
+        if heap:
+            yield from _sift_down(heap, 0, dest)
+
+
+def _sift_down(heap, root, dest):
+    """Restore the min-heap property below root, yielding a COMPARE at dest per comparison."""
+    size = len(heap)
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size:
+            yield COMPARE, dest, NO_INDEX
+            if heap[child + 1] < heap[child]:
+                child += 1
+        yield COMPARE, dest, NO_INDEX
+        if not heap[child] < heap[root]:
+            return
+        heap[root], heap[child] = heap[child], heap[root]
+        root = child
+
+
+ALGORITHMS = {
+    "Merge Sort (Parallel)": {
+        "entry": parallel_merge_sort,
+        "description": "Chunks merge sorted by worker processes in shared memory,\nthen heap merged. Slower than serial without idle cores.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(n)",
+        "stability": "Stable",
+        "best_case": "O(n log n) - always same",
+    },
+}
@@ -0,0 +1,198 @@
+"""
+Profiler
+========
+Optional timing of the visualizer's hot paths, shown as a canvas overlay.
+
+When the visualizer feels slow the time can go to the sort itself, to
+pacing sleeps, to drawing, or to a backlog in the Tk event loop. The
+profiler keeps a few cheap measurements to tell them apart:
+
+- draw time of every frame, as a histogram and percentiles
+- CPU and wall time of the sort thread (the difference is time spent
+  waiting: pacing sleeps, pauses, lock contention)
+- event loop lag: how late the overlay's own refresh timer fires, which
+  grows with the backlog of queued callbacks
+
+It can also run cProfile over the sort thread and dump the result as a
+pstats file for offline analysis (``python -m pstats <file>``).
+"""
+
+import cProfile
+import os
+import re
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+# Upper bounds of the frame time histogram buckets, in milliseconds
+FRAME_BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66)
+
+# Characters used to draw histogram bars, from empty to full
+HISTOGRAM_BARS = " ▁▂▃▄▅▆▇█"
+
+
+class Profiler:
+    """
+    Collect frame, sort-thread and event-loop timings while enabled.
+
+    add_frame and add_loop_lag are called on the main thread; begin_run,
+    sample_run and end_run on the sort thread.
+
+    Attributes:
+        enabled (bool): Whether measurements are being collected
+        frames (int): Frames measured since reset()
+        histogram (List[int]): Frame counts per FRAME_BUCKETS_MS bucket,
+            plus one for slower frames
+        algorithm_cpu_s (float): CPU time of the current/last sort thread
+        algorithm_wall_s (float): Wall time of the current/last sort thread
+        last_dump (Optional[str]): Path of the last pstats file written
+    """
+
+    def __init__(self, history: int = 600, dump_dir: Optional[str] = None):
+        """
+        Initialize the profiler (disabled).
+
+        Args:
+            history: Number of recent frames kept for percentiles
+            dump_dir: Directory for pstats files (default: working directory)
+        """
+        self.enabled = False
+        self.dump_dir = dump_dir
+        self.last_dump: Optional[str] = None
+        self._recent: Deque[float] = deque(maxlen=history)
+        self._lag: Deque[float] = deque(maxlen=history)
+        self._profile: Optional[cProfile.Profile] = None
+        self._cpu_start = 0.0
+        self._wall_start = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every measurement."""
+        self.frames = 0
+        self.histogram: List[int] = [0] * (len(FRAME_BUCKETS_MS) + 1)
+        self._recent.clear()
+        self._lag.clear()
+        self.algorithm_cpu_s = 0.0
+        self.algorithm_wall_s = 0.0
+
+    # ==================== MAIN THREAD ====================
+
+    def add_frame(self, ms: float) -> None:
+        """
+        Record the draw time of one frame.
+
+        Args:
+            ms: Time the frame took to draw, in milliseconds
+        """
+        self.frames += 1
+        self._recent.append(ms)
+        for bucket, bound in enumerate(FRAME_BUCKETS_MS):
+            if ms < bound:
+                break
+        else:
+            bucket = len(FRAME_BUCKETS_MS)
+        self.histogram[bucket] += 1
+
+    def add_loop_lag(self, ms: float) -> None:
+        """
+        Record how late a timer callback ran.
+
+        Args:
+            ms: Delay beyond the requested time, in milliseconds
+        """
+        self._lag.append(max(ms, 0.0))
+
+    # ==================== SORT THREAD ====================
+
+    def begin_run(self) -> None:
+        """Start timing (and cProfiling) the calling thread."""
+        self._cpu_start = time.thread_time()
+        self._wall_start = time.perf_counter()
+        self.algorithm_cpu_s = self.algorithm_wall_s = 0.0
+        self._profile = cProfile.Profile()
+        try:
+            self._profile.enable()
+        except ValueError:
+            # Another profiler is already active in this interpreter
+            self._profile = None
+
+    def sample_run(self) -> None:
+        """Update the CPU and wall time of the calling (sort) thread."""
+        self.algorithm_cpu_s = time.thread_time() - self._cpu_start
+        self.algorithm_wall_s = time.perf_counter() - self._wall_start
+
+    def end_run(self, label: str) -> Optional[str]:
+        """
+        Stop timing the calling thread and dump its cProfile statistics.
+
+        Args:
+            label: Name for the run, used in the file name
+
+        Returns:
+            Path of the pstats file, or None if it could not be written
+        """
+        self.sample_run()
+        profile, self._profile = self._profile, None
+        if profile is None:
+            return None
+        profile.disable()
+
+        slug = re.sub(r'[^a-z0-9]+', '-', label.lower()).strip('-')
+        name = f"profile-{slug}-{time.strftime('%Y%m%d-%H%M%S')}.pstats"
+        path = os.path.join(self.dump_dir or os.getcwd(), name)
+        try:
+            profile.dump_stats(path)
+        except OSError:
+            return None
+        self.last_dump = path
+        return path
+
+    # ==================== REPORTING ====================
+
+    def percentile(self, fraction: float) -> float:
+        """Return a percentile of the recent frame times in milliseconds."""
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def histogram_text(self) -> str:
+        """Return the frame time histogram as one line of bar characters."""
+        peak = max(self.histogram) or 1
+        top = len(HISTOGRAM_BARS) - 1
+        bars = ''.join(HISTOGRAM_BARS[round(count / peak * top)] for count in self.histogram)
+        labels = f"<{FRAME_BUCKETS_MS[0]}ms … ≥{FRAME_BUCKETS_MS[-1]}ms"
+        return f"[{bars}] {labels}"
+
+    def summary(self, scheduler=None) -> str:
+        """
+        Return the overlay text.
+
+        Args:
+            scheduler: Optional RenderScheduler whose frame counters to include
+
+        Returns:
+            Multi-line summary of the current measurements
+        """
+        lines = [
+            "📊 Profiler",
+            f"🖼️ Frames: {self.frames}  p50 {self.percentile(0.5):.1f} ms  "
+            f"p95 {self.percentile(0.95):.1f} ms  "
+            f"max {max(self._recent, default=0.0):.1f} ms",
+            self.histogram_text(),
+        ]
+        if scheduler is not None:
+            lines.append(
+                f"📬 Submitted {scheduler.frames_produced}  drawn {scheduler.frames_rendered}  "
+                f"dropped {scheduler.frames_dropped}  over budget {scheduler.frames_over_budget}"
+            )
+        if self._lag:
+            lines.append(
+                f"⏳ Event loop lag: avg {sum(self._lag) / len(self._lag):.1f} ms  "
+                f"max {max(self._lag):.1f} ms"
+            )
+        waited = max(self.algorithm_wall_s - self.algorithm_cpu_s, 0.0)
+        lines.append(f"🧮 Algorithm CPU: {self.algorithm_cpu_s:.2f} s  waiting: {waited:.2f} s")
+        if self.last_dump:
+            lines.append(f"💾 {os.path.basename(self.last_dump)}")
+        return '\n'.join(lines)
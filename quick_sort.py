@@ -3,59 +3,238 @@ Quick Sort Algorithm
 Team Member: Hossam Aqeel
 """
 
-import time
+from events import COMPARE, MARK, PIVOT, SWAP
 
-def quick_sort(array, draw_data, delay_func, is_sorting_func, update_stats_func):
+# Ranges at least this long use a ninther instead of a median of three
+NINTHER_THRESHOLD = 40
+
+
+def quick_sort(array):
     """
     Quick Sort: Partitions array around pivot and recursively sorts.
     Time Complexity: O(n log n) average, O(n²) worst case
     Space Complexity: O(log n)
     Stability: Unstable
+    
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and swap (see events.py).
+    
+    The recursion is unrolled onto an explicit stack (left side first, as
+    in the recursive version): every event of a generator nested through
+    ``yield from`` passes through each enclosing generator, which made
+    the O(n)-deep recursion on sorted input quadratic in depth.
     """
-    comparisons = 0
-    swaps = 0
+    stack = [(0, len(array) - 1)]
     
-    def quick_sort_recursive(low, high, comps, swps):
-        if low < high and is_sorting_func():
-            pi, c, s = partition(low, high, comps, swps)
-            c1, s1 = quick_sort_recursive(low, pi - 1, c, s)
-            return quick_sort_recursive(pi + 1, high, c1, s1)
-        return comps, swps
+    while stack:
+        low, high = stack.pop()
+        if low < high:
+            pi = yield from partition(array, low, high)
+            stack.append((pi + 1, high))
+            stack.append((low, pi - 1))
 
-    def partition(low, high, comps, swps):
-        if not is_sorting_func(): 
-            return low, comps, swps
-        
-        pivot = array[high]
-        i = low - 1
-        
-        for j in range(low, high):
-            if not is_sorting_func(): 
-                return i, comps, swps
+
+def quick_sort_iterative(array, pivot="auto"):
+    """
+    Iterative Quick Sort: Quick sort driven by an explicit stack.
+    Time Complexity: O(n log n) average, O(n²) worst case
+    Space Complexity: O(log n)
+    Stability: Unstable
+    
+    The smaller partition is always processed first and the larger one is
+    pushed on the stack, so the stack never holds more than O(log n)
+    ranges and there is no Python recursion at all.
+    
+    Args:
+        array: List to sort in place
+        pivot: Pivot selection - "last" (plain Lomuto), "median3",
+               "ninther", or "auto" (median of three for short ranges,
+               ninther for long ones)
+    
+    Yields an (op, a, b) step event after each comparison and swap
+    (see events.py), including those made while choosing pivots.
+    """
+    stack = [(0, len(array) - 1)]
+    
+    while stack:
+        low, high = stack.pop()
+        while low < high:
+            p = yield from choose_pivot(array, low, high, pivot)
+            if p != high:
+                array[p], array[high] = array[high], array[p]
+                yield SWAP, p, high
             
-            comps += 1
-            draw_data([j, high], ['comparing', 'pivot'])
-            update_stats_func(comps, swps)
-            time.sleep(delay_func())
+            pi = yield from partition(array, low, high)
             
-            if array[j] < pivot:
-                i += 1
-                if i != j:
-                    array[i], array[j] = array[j], array[i]
-                    swps += 1
-                    
-                    draw_data([i, j], ['swapping', 'swapping'])
-                    update_stats_func(comps, swps)
-                    time.sleep(delay_func())
-        
-        if is_sorting_func():
-            array[i + 1], array[high] = array[high], array[i + 1]
-            swps += 1
+            if pi - low < high - pi:
+                stack.append((pi + 1, high))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1))
+                low = pi + 1
+
+
+def quick_sort_three_way(array, pivot="auto"):
+    """
+    Three-Way Quick Sort: Quick sort that groups keys equal to the pivot.
+    Time Complexity: O(n log n) average, O(n log k) for k distinct keys
+    Space Complexity: O(log n)
+    Stability: Unstable
+    
+    Each partition splits its range into < pivot, == pivot and > pivot
+    (Dijkstra's Dutch national flag). The equal band is final and is never
+    looked at again, so a run of duplicate keys is finished in a single
+    pass instead of being split one element at a time by the two-way
+    partition, which is quadratic when there are only a few distinct keys.
+    
+    Args:
+        array: List to sort in place
+        pivot: Pivot selection, as for quick_sort_iterative
+    
+    Yields an (op, a, b) step event after each comparison and swap, plus a
+    MARK of the equal band's two ends after each partition (see events.py).
+    """
+    stack = [(0, len(array) - 1)]
+    
+    while stack:
+        low, high = stack.pop()
+        while low < high:
+            p = yield from choose_pivot(array, low, high, pivot)
+            if p != low:
+                array[p], array[low] = array[low], array[p]
+                yield SWAP, p, low
+            
+            lt, gt = yield from partition_three_way(array, low, high)
             
-            draw_data([i + 1, high], ['swapping', 'swapping'])
-            update_stats_func(comps, swps)
-            time.sleep(delay_func())
+            if lt - low < high - gt:
+                stack.append((gt + 1, high))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1))
+                low = gt + 1
+
+
+def partition_three_way(array, low, high):
+    """
+    Dutch national flag partition of array[low:high + 1] around array[low].
+    
+    Keeps array[low:lt] < pivot, array[lt:i] == pivot and
+    array[gt + 1:high + 1] > pivot while i scans the unknown middle.
+    Yields step events and returns (lt, gt), the bounds of the equal band.
+    """
+    pivot = array[low]
+    lt = low
+    i = low + 1
+    gt = high
+    
+    while i <= gt:
+        # array[lt] is always a copy of the pivot
+        yield PIVOT, i, lt
+        if array[i] < pivot:
+            array[lt], array[i] = array[i], array[lt]
+            yield SWAP, lt, i
+            lt += 1
+            i += 1
+            continue
+        
+        yield PIVOT, i, lt
+        if pivot < array[i]:
+            array[i], array[gt] = array[gt], array[i]
+            yield SWAP, i, gt
+            gt -= 1
+        else:
+            i += 1
+    
+    yield MARK, lt, gt
+    return lt, gt
+
+
+def partition(array, low, high):
+    """
+    Lomuto partition of array[low:high + 1] around array[high].
+    
+    Yields step events and returns the pivot's final index.
+    """
+    pivot = array[high]
+    i = low - 1
+    
+    for j in range(low, high):
+        yield PIVOT, j, high
         
-        return i + 1, comps, swps
+        if array[j] < pivot:
+            i += 1
+            if i != j:
+                array[i], array[j] = array[j], array[i]
+                yield SWAP, i, j
+    
+    array[i + 1], array[high] = array[high], array[i + 1]
+    yield SWAP, i + 1, high
+    
+    return i + 1
+
+
+def choose_pivot(array, low, high, method="auto"):
+    """
+    Pick a pivot index in array[low:high + 1].
+    
+    Yields a COMPARE event per comparison and returns the chosen index.
+    """
+    size = high - low + 1
+    if method == "last" or size < 3:
+        return high
+    
+    mid = (low + high) // 2
+    if method == "median3" or (method == "auto" and size < NINTHER_THRESHOLD):
+        return (yield from median_of_three(array, low, mid, high))
+    
+    # Ninther: median of the medians of three evenly spaced triples
+    step = size // 8
+    m1 = yield from median_of_three(array, low, low + step, low + 2 * step)
+    m2 = yield from median_of_three(array, mid - step, mid, mid + step)
+    m3 = yield from median_of_three(array, high - 2 * step, high - step, high)
+    return (yield from median_of_three(array, m1, m2, m3))
+
+
+def median_of_three(array, a, b, c):
+    """Yield COMPARE events and return the index holding the median of a, b, c."""
+    yield COMPARE, a, b
+    if array[a] < array[b]:
+        yield COMPARE, b, c
+        if array[b] < array[c]:
+            return b
+        yield COMPARE, a, c
+        return c if array[a] < array[c] else a
+    
+    yield COMPARE, a, c
+    if array[a] < array[c]:
+        return a
+    yield COMPARE, b, c
+    return c if array[b] < array[c] else b
+
 
-    quick_sort_recursive(0, len(array) - 1, comparisons, swaps)
+ALGORITHMS = {
+    "Quick Sort": {
+        "entry": quick_sort,
+        "description": "Partitions array around pivot and recursively sorts.\nFast average case, but O(n²) worst case.",
+        "time_complexity": "O(n log n) avg, O(n²) worst",
+        "space_complexity": "O(log n)",
+        "stability": "Unstable",
+        "best_case": "O(n log n) - balanced partitions",
+    },
+    "Quick Sort (Iterative)": {
+        "entry": quick_sort_iterative,
+        "description": "Explicit-stack quick sort with median-of-three/ninther pivots.\nSmaller partition first, so no deep recursion on sorted input.",
+        "time_complexity": "O(n log n) avg, O(n²) worst",
+        "space_complexity": "O(log n)",
+        "stability": "Unstable",
+        "best_case": "O(n log n) - balanced partitions",
+    },
+    "Quick Sort (3-Way)": {
+        "entry": quick_sort_three_way,
+        "description": "Quick sort with a Dutch national flag partition: keys equal\nto the pivot are grouped and finished in one pass.",
+        "time_complexity": "O(n log n) avg, O(n log k) for k keys",
+        "space_complexity": "O(log n)",
+        "stability": "Unstable",
+        "best_case": "O(n) - few distinct keys",
+    },
+}
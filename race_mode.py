@@ -0,0 +1,337 @@
+"""
+Race Mode
+=========
+Several algorithms sorting copies of the same array side by side.
+
+Each pane drives its algorithm's step generator directly on the main
+thread. One shared frame clock advances every pane by the same number of
+operations and then redraws all of them in a single pass, so the
+algorithms race at equal operation rates and the event loop sees one timer
+rather than a thread and a stream of callbacks per algorithm.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from array_model import ArrayModel
+from counters import SortCounters
+from events import SILENT_OPS, SWAP, SWAP_OPS, event_highlight
+from image_renderer import ImageRenderer
+from registry import get_algorithm
+from render_scheduler import frame_delay
+
+# Algorithms raced by default
+RACE_ALGORITHMS = (
+    "Bubble Sort",
+    "Selection Sort",
+    "Insertion Sort",
+    "Merge Sort",
+    "Quick Sort",
+)
+
+# Height of the title and counters above each pane's bars, in pixels
+HEADER_HEIGHT = 40
+
+
+class RacePane:
+    """
+    One algorithm's lane: its copy of the array, generator, counters and drawing.
+
+    Attributes:
+        name (str): Display name of the algorithm
+        array (List[int]): This pane's copy of the input
+        counters (SortCounters): Operations performed so far
+        finished (bool): Whether the algorithm has completed
+        place (int): Finishing position (1 for the winner), 0 while running
+    """
+
+    def __init__(self, name: str, values: Sequence[int], colors: Dict[str, str],
+                 image_threshold: int):
+        """
+        Create a pane.
+
+        Args:
+            name: Display name of a registered algorithm
+            values: Input array (copied)
+            colors: Bar colors for each highlight state
+            image_threshold: Array sizes above this are drawn into a PhotoImage
+        """
+        self.name = name
+        self.array = list(values)
+        self.model = ArrayModel(self.array, colors)
+        self.image_threshold = image_threshold
+        self._events = get_algorithm(name)['entry'](self.array)
+
+        self.counters = SortCounters()
+        self.finished = False
+        self.place = 0
+
+        self._highlight: Tuple[List[int], List[str]] = ([], [])
+        self._highlighted: List[int] = []
+        self._touched = set()
+        self._redraw_all = True
+
+        self.canvas = None
+        self._tag = f"race-bar-{id(self)}"
+        self._bar_items: List[int] = []
+        self._image: Optional[ImageRenderer] = None
+        self._text_item = None
+
+    def layout(self, canvas, left: int, top: int, width: int, height: int,
+               background: str, text_color: str) -> None:
+        """
+        Create the pane's canvas items in a rectangle of the canvas.
+
+        Args:
+            canvas: Canvas to draw on
+            left: x of the pane's left edge
+            top: y of the pane's top edge
+            width: Pane width in pixels
+            height: Pane height in pixels
+            background: Canvas background color
+            text_color: Color of the title and counters
+        """
+        self.canvas = canvas
+        self._bar_items = []
+        self._image = None
+        self._text_item = canvas.create_text(
+            left + width / 2, top + 4,
+            anchor='n',
+            justify='center',
+            font=('Arial', 9, 'bold'),
+            fill=text_color
+        )
+
+        bars_top = top + HEADER_HEIGHT
+        bars_height = height - HEADER_HEIGHT
+        if len(self.array) > self.image_threshold:
+            self._image = ImageRenderer(canvas, self.model, width, bars_height,
+                                        background, left, bars_top)
+        else:
+            self.model.layout(width, bars_height, left, bars_top)
+            for x1, y1, x2, y2 in self.model.all_coords():
+                self._bar_items.append(canvas.create_rectangle(
+                    x1, y1, x2, y2,
+                    fill=self.model.color(len(self._bar_items)),
+                    outline='',
+                    tags=self._tag
+                ))
+        self._redraw_all = True
+
+    def advance(self, count: int) -> int:
+        """
+        Run up to count operations of the algorithm.
+
+        Args:
+            count: Number of operations to run
+
+        Returns:
+            Number of operations run, less than count if the algorithm
+            finished during this call
+        """
+        if self.finished:
+            return 0
+        remaining = count
+        touched = self._touched
+        record = self.counters.record
+        last = None
+        while remaining > 0:
+            event = next(self._events, None)
+            if event is None:
+                self.finished = True
+                break
+            op, a, b = event
+            record(op, a, b)
+            if op in SILENT_OPS:
+                continue
+            if op in SWAP_OPS:
+                touched.add(a)
+                if op == SWAP:
+                    touched.add(b)
+            last = event
+            remaining -= 1
+
+        if last is not None:
+            self._highlight = event_highlight(*last)
+        return count - remaining
+
+    def draw(self) -> None:
+        """Bring the pane's bars and counters up to date."""
+        model = self.model
+        if self.finished:
+            if self._highlighted is not None:
+                # First draw since finishing: paint the whole array as sorted
+                color = model.fill('sorted')
+                self._highlighted = None
+                if self._image is not None:
+                    self._redraw_all = True
+                else:
+                    self.canvas.itemconfigure(self._tag, fill=color)
+        else:
+            touched = self._touched
+            for i in self._highlighted:
+                model.set_state(i, 'normal')
+                touched.add(i)
+            indices, colors = self._highlight
+            for i, key in zip(indices, colors):
+                model.set_state(i, key)
+                touched.add(i)
+            self._highlighted = indices
+
+        if self._redraw_all:
+            self._redraw_all = False
+            self._touched = set()
+            if self._image is not None:
+                self._image.draw_all()
+            else:
+                self._redraw_bars(range(len(self.array)))
+        elif self._touched:
+            touched, self._touched = self._touched, set()
+            if self._image is not None:
+                self._image.update(touched)
+            else:
+                self._redraw_bars(touched)
+
+        title = f"🏁 #{self.place} {self.name}" if self.place else self.name
+        self.canvas.itemconfigure(
+            self._text_item,
+            text=f"{title}\n🔍 {self.counters.comparisons:,}  🔄 {self.counters.swaps:,}"
+        )
+
+    def _redraw_bars(self, indices) -> None:
+        """Move and recolor the rectangles of the given bars."""
+        canvas = self.canvas
+        model = self.model
+        for i in indices:
+            item = self._bar_items[i]
+            canvas.coords(item, *model.coords(i))
+            canvas.itemconfigure(item, fill=model.color(i))
+
+
+class Race:
+    """
+    Run several panes from one shared frame clock on the tkinter main loop.
+
+    Attributes:
+        panes (List[RacePane]): One pane per algorithm, left to right
+        paused (bool): Whether the clock is stopped waiting for resume/step
+        running (bool): Whether the clock is armed
+    """
+
+    def __init__(self, root, canvas, names: Sequence[str], values: Sequence[int],
+                 colors: Dict[str, str], pace: Callable[[], Tuple[float, int]],
+                 on_finish: Callable[[], None], image_threshold: int):
+        """
+        Create a race.
+
+        Args:
+            root: The tkinter root window that owns the timer
+            canvas: Canvas to draw the panes on
+            names: Display names of the algorithms to race
+            values: Input array, copied into every pane
+            colors: Bar colors for each highlight state
+            pace: Returns the current (delay in seconds, operations per step)
+            on_finish: Called on the main thread when every pane is done
+            image_threshold: Array sizes above this are drawn into a PhotoImage
+        """
+        self.root = root
+        self.canvas = canvas
+        self.pace = pace
+        self.on_finish = on_finish
+        self.panes = [RacePane(name, values, colors, image_threshold) for name in names]
+        self.paused = False
+        self.running = False
+        self._finished_count = 0
+        self._after_id = None
+
+    def layout(self, width: int, height: int, background: str, text_color: str) -> None:
+        """
+        Recreate the panes' canvas items for a canvas size.
+
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            background: Canvas background color
+            text_color: Color of the pane titles and counters
+        """
+        self.canvas.delete("all")
+        pane_width = width / len(self.panes)
+        for k, pane in enumerate(self.panes):
+            pane.layout(self.canvas, round(k * pane_width), 0, round(pane_width),
+                        height, background, text_color)
+            pane.draw()
+
+    def start(self) -> None:
+        """Start the frame clock."""
+        self.running = True
+        self.paused = False
+        self._arm(0.0)
+
+    def stop(self) -> None:
+        """Stop the frame clock; the panes keep their current state."""
+        self.running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def pause(self) -> None:
+        """Stop advancing the panes until resume() or step()."""
+        self.paused = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def resume(self) -> None:
+        """Continue after pause()."""
+        if self.running and self.paused:
+            self.paused = False
+            self._arm(0.0)
+
+    def step(self, count: int) -> None:
+        """
+        Pause and advance every pane by count operations.
+
+        Args:
+            count: Number of operations per pane
+        """
+        if not self.running:
+            return
+        self.pause()
+        self._advance(count)
+
+    def _arm(self, frame_ms: float) -> None:
+        """Schedule the next tick, minus the time the last one took."""
+        delay, _ = self.pace()
+        self._after_id = self.root.after(frame_delay(delay * 1000, frame_ms), self._tick)
+
+    def _tick(self) -> None:
+        """Timer callback: advance all panes one step and draw them."""
+        self._after_id = None
+        if not self.running or self.paused:
+            return
+        started = time.perf_counter()
+        _, count = self.pace()
+        self._advance(count)
+        if self.running:
+            self._arm((time.perf_counter() - started) * 1000)
+
+    def _advance(self, count: int) -> None:
+        """Advance every running pane, redraw all panes and detect the end."""
+        finishers = []
+        for pane in self.panes:
+            if not pane.finished:
+                used = pane.advance(count)
+                if pane.finished:
+                    finishers.append((used, pane))
+        # Panes that finish in the same tick are ranked by the operations
+        # they needed within it; equal counts share a place
+        for used, pane in finishers:
+            pane.place = self._finished_count + 1 + sum(
+                1 for other, _ in finishers if other < used)
+        self._finished_count += len(finishers)
+        for pane in self.panes:
+            pane.draw()
+
+        if self._finished_count == len(self.panes):
+            self.stop()
+            self.on_finish()
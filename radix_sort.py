@@ -0,0 +1,131 @@
+"""
+Radix Sort Algorithm
+LSD and MSD radix sorts over base-256 digits
+"""
+
+from counting_sort import key_range
+from events import ALLOC, NO_INDEX, READ, WRITE
+from insertion_sort import insertion_sort_range
+
+# Bits per digit: each pass distributes into 2 ** RADIX_BITS buckets
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+
+# MSD buckets this small are finished with insertion sort
+MSD_INSERTION_THRESHOLD = 16
+
+
+def radix_sort_lsd(array):
+    """
+    LSD Radix Sort: Stable distribution by each digit, least significant first.
+    Time Complexity: O(d * n) for d digits
+    Space Complexity: O(n + b) for b buckets
+    Stability: Stable
+
+    Each pass deals the elements into one bucket per value of a digit and
+    writes the buckets back in order. As every pass is stable, after the
+    pass on the most significant digit the array is sorted. Keys are
+    taken relative to the smallest value, so negative integers work and
+    small key ranges need few passes.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    element read and write (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    lowest, highest = yield from key_range(array)
+    yield ALLOC, n + RADIX, NO_INDEX
+
+    shift = 0
+    while (highest - lowest) >> shift:
+        buckets = [[] for _ in range(RADIX)]
+        for i in range(n):
+            buckets[((array[i] - lowest) >> shift) & (RADIX - 1)].append(array[i])
+            yield READ, i, NO_INDEX
+
+        k = 0
+        for bucket in buckets:
+            for value in bucket:
+                array[k] = value
+                yield WRITE, k, NO_INDEX
+                k += 1
+        shift += RADIX_BITS
+
+    yield ALLOC, -(n + RADIX), NO_INDEX
+
+
+def radix_sort_msd(array):
+    """
+    MSD Radix Sort: Distribution by the most significant digit, then each bucket.
+    Time Complexity: O(d * n) for d digits
+    Space Complexity: O(n + d * b) for b buckets
+    Stability: Stable
+
+    The range is dealt into buckets by its most significant digit and
+    written back; every bucket is then sorted on the next digit on its
+    own. Buckets of equal keys are done as soon as the digits run out and
+    small buckets are finished with insertion sort, so unlike LSD it
+    stops early on inputs whose prefixes already tell elements apart.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    element read and write, and each comparison in the insertion sorts
+    (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    lowest, highest = yield from key_range(array)
+
+    top_shift = 0
+    while (highest - lowest) >> (top_shift + RADIX_BITS):
+        top_shift += RADIX_BITS
+
+    stack = [(0, n - 1, top_shift)]
+
+    while stack:
+        low, high, shift = stack.pop()
+        if high - low + 1 <= MSD_INSERTION_THRESHOLD:
+            yield from insertion_sort_range(array, low, high)
+            continue
+
+        size = high - low + 1
+        buckets = [[] for _ in range(RADIX)]
+        yield ALLOC, size + RADIX, NO_INDEX
+        for i in range(low, high + 1):
+            buckets[((array[i] - lowest) >> shift) & (RADIX - 1)].append(array[i])
+            yield READ, i, NO_INDEX
+
+        k = low
+        for bucket in buckets:
+            start = k
+            for value in bucket:
+                array[k] = value
+                yield WRITE, k, NO_INDEX
+                k += 1
+            if shift and k - start > 1:
+                stack.append((start, k - 1, shift - RADIX_BITS))
+
+        yield ALLOC, -(size + RADIX), NO_INDEX
+
+
+ALGORITHMS = {
+    "Radix Sort (LSD)": {
+        "entry": radix_sort_lsd,
+        "description": "Stable passes over base-256 digits, least significant first.\nNo comparisons; linear for bounded integer keys.",
+        "time_complexity": "O(d·n)",
+        "space_complexity": "O(n + b)",
+        "stability": "Stable",
+        "best_case": "O(d·n) - always same",
+    },
+    "Radix Sort (MSD)": {
+        "entry": radix_sort_msd,
+        "description": "Buckets by the most significant digit, then each bucket\nby the next. Small buckets finish with insertion sort.",
+        "time_complexity": "O(d·n)",
+        "space_complexity": "O(n + d·b)",
+        "stability": "Stable",
+        "best_case": "O(n) - keys differ in the first digit",
+    },
+}
@@ -0,0 +1,99 @@
+"""
+Algorithm Registry
+==================
+Lookup table from algorithm display names to their implementations.
+
+Each algorithm module declares an ``ALGORITHMS`` dict mapping display
+names to metadata and the generator entry point:
+
+    ALGORITHMS = {
+        "Bubble Sort": {
+            "entry": bubble_sort,
+            "description": "...",
+            "time_complexity": "O(n²)",
+            "space_complexity": "O(1)",
+            "stability": "Stable",
+            "best_case": "O(n) - when already sorted",
+        },
+    }
+
+The registry only knows which module provides each name; a module is
+imported the first time one of its algorithms is requested. Third-party
+packages can add algorithms through the ``sorting_visualizer.algorithms``
+entry point group, where the entry point name is the display name and
+its value is the module that declares it.
+"""
+
+import importlib
+from importlib import metadata
+from typing import Any, Dict, List
+
+ENTRY_POINT_GROUP = "sorting_visualizer.algorithms"
+
+# Built-in algorithms: display name -> module name
+BUILTIN_ALGORITHMS = {
+    "Bubble Sort": "bubble_sort",
+    "Selection Sort": "selection_sort",
+    "Insertion Sort": "insertion_sort",
+    "Merge Sort": "merge_sort",
+    "Quick Sort": "quick_sort",
+    "Merge Sort (Bottom-Up)": "merge_sort",
+    "Quick Sort (Iterative)": "quick_sort",
+    "Merge Sort (Preallocated)": "merge_sort",
+    "Merge Sort (Parallel)": "parallel_merge_sort",
+    "Quick Sort (3-Way)": "quick_sort",
+    "Tim Sort": "tim_sort",
+    "Intro Sort": "intro_sort",
+    "Counting Sort": "counting_sort",
+    "Radix Sort (LSD)": "radix_sort",
+    "Radix Sort (MSD)": "radix_sort",
+    "Bucket Sort": "bucket_sort",
+    "Heap Sort": "heap_sort",
+    "Heap Sort (Bottom-Up)": "heap_sort",
+    "Block Merge Sort (In-Place)": "block_merge_sort",
+}
+
+_sources: Dict[str, Any] = {}
+_loaded: Dict[str, Dict[str, Any]] = {}
+
+
+def _discover() -> Dict[str, Any]:
+    """Return display name -> module name or entry point, discovering once."""
+    if not _sources:
+        _sources.update(BUILTIN_ALGORITHMS)
+        try:
+            entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10 returns a dict of groups
+            entry_points = metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+        for entry_point in entry_points:
+            _sources.setdefault(entry_point.name, entry_point)
+    return _sources
+
+
+def algorithm_names() -> List[str]:
+    """Return the display names of every registered algorithm."""
+    return list(_discover())
+
+
+def get_algorithm(name: str) -> Dict[str, Any]:
+    """
+    Return the metadata of an algorithm, importing its module if needed.
+
+    Args:
+        name: Display name of the algorithm
+
+    Returns:
+        The module's ALGORITHMS entry; ``entry`` is the generator function
+
+    Raises:
+        KeyError: If no algorithm is registered under that name
+    """
+    if name not in _loaded:
+        source = _discover()[name]
+        if isinstance(source, str):
+            module = importlib.import_module(source)
+        else:
+            module = source.load()
+        _loaded[name] = module.ALGORITHMS[name]
+    return _loaded[name]
@@ -0,0 +1,187 @@
+"""
+Render Scheduler
+================
+Frame-coalescing bridge between a sorting thread and the tkinter main loop.
+
+Sorting algorithms report every comparison and swap. When they run faster
+than the GUI can paint, posting one ``root.after`` callback per step makes
+the event queue grow without bound. The scheduler instead keeps only the
+latest pending frame and statistics snapshot and presents them from a
+fixed-rate timer on the main loop, dropping the intermediate frames.
+
+Frames are presented from timer callbacks only and never force a
+synchronous ``update()``: Tk repaints the canvas from its own idle
+handlers once the callback returns. Each tick measures how long it took
+and waits out only the rest of its frame budget, keeping a minimum gap so
+input events and the idle-time repaint always get a turn.
+"""
+
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from counters import SortCounters
+
+# Minimum delay between frames in milliseconds, left to the event loop
+MIN_IDLE_MS = 2
+
+
+def frame_delay(interval_ms: float, frame_ms: float) -> int:
+    """
+    Return the delay before the next frame.
+
+    Args:
+        interval_ms: Target time between frames in milliseconds
+        frame_ms: Time the last frame took to present in milliseconds
+
+    Returns:
+        The rest of the frame budget, but at least MIN_IDLE_MS
+    """
+    return max(MIN_IDLE_MS, round(interval_ms - frame_ms))
+
+
+class RenderScheduler:
+    """
+    Coalesce frames produced by a worker thread and flush them at a fixed rate.
+
+    Frames are submitted from any thread with submit_frame/submit_stats.
+    start/stop/flush must be called from the tkinter main thread.
+
+    Bars highlighted by a dropped frame may have changed value, so their
+    indices are accumulated and handed to the draw function as ``dirty``
+    on the next flush.
+
+    Statistics either come from submit_stats snapshots or, when start() is
+    given a SortCounters object, are sampled from it on every flush.
+
+    Attributes:
+        fps (int): Target presentation rate in frames per second
+        frames_produced (int): Frames submitted since start()
+        frames_rendered (int): Frames actually drawn since start()
+        frames_dropped (int): Frames replaced before they could be drawn
+        last_frame_ms (float): Time the last tick took to present, in ms
+        frames_over_budget (int): Ticks that took longer than interval_ms
+    """
+
+    def __init__(self, root, draw_func: Callable[..., None],
+                 stats_func: Callable[[int, int, int], None], fps: int = 60):
+        """
+        Initialize the scheduler.
+
+        Args:
+            root: The tkinter root window that owns the timer
+            draw_func: Called as draw_func(indices, colors, dirty, fill) on flush
+            stats_func: Called as stats_func(comparisons, swaps, aux_peak) on flush
+            fps: Target presentation rate in frames per second
+        """
+        self.root = root
+        self.draw_func = draw_func
+        self.stats_func = stats_func
+        self.fps = fps
+
+        self._lock = threading.Lock()
+        self._frame: Optional[Tuple[List[int], List[str], Optional[str]]] = None
+        self._dirty: Set[int] = set()
+        self._stats: Optional[Tuple[int, int, int]] = None
+        self._after_id = None
+        self.counters: Optional[SortCounters] = None
+
+        self.frames_produced = 0
+        self.frames_rendered = 0
+        self.frames_dropped = 0
+        self.last_frame_ms = 0.0
+        self.frames_over_budget = 0
+
+    @property
+    def interval_ms(self) -> int:
+        """Delay between flushes in milliseconds."""
+        return max(1, 1000 // self.fps)
+
+    # ==================== PRODUCER SIDE (ANY THREAD) ====================
+
+    def submit_frame(self, indices: List[int], colors: List[str],
+                     dirty: Iterable[int] = (), fill: Optional[str] = None) -> None:
+        """
+        Replace the pending frame with a new one.
+
+        Args:
+            indices: Indices to highlight
+            colors: Color keys corresponding to each index
+            dirty: Other indices written since the previous frame (for
+                   producers that batch several steps into one frame)
+            fill: Color key for every bar that is not highlighted
+                  (None for the normal color)
+        """
+        with self._lock:
+            self._dirty.update(dirty)
+            if self._frame is not None:
+                self.frames_dropped += 1
+                self._dirty.update(self._frame[0])
+            self._frame = (list(indices), list(colors), fill)
+            self.frames_produced += 1
+
+    def submit_stats(self, comparisons: int, swaps: int, aux_peak: int = 0) -> None:
+        """
+        Replace the pending statistics snapshot.
+
+        Args:
+            comparisons: Comparisons made so far
+            swaps: Swaps made so far
+            aux_peak: Peak auxiliary memory so far, in elements
+        """
+        with self._lock:
+            self._stats = (comparisons, swaps, aux_peak)
+
+    # ==================== CONSUMER SIDE (MAIN THREAD) ====================
+
+    def start(self, counters: Optional[SortCounters] = None) -> None:
+        """
+        Reset the frame counters and start the presentation timer.
+
+        Args:
+            counters: Operation counters to sample on every flush, if any
+        """
+        self.stop()
+        self.counters = counters
+        with self._lock:
+            self._frame = None
+            self._dirty = set()
+            self._stats = None
+        self.frames_produced = 0
+        self.frames_rendered = 0
+        self.frames_dropped = 0
+        self.frames_over_budget = 0
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        """Stop the presentation timer after presenting anything pending."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Present the pending frame and statistics, if any."""
+        with self._lock:
+            frame, self._frame = self._frame, None
+            dirty, self._dirty = self._dirty, set()
+            stats, self._stats = self._stats, None
+        if stats is None and self.counters is not None:
+            stats = self.counters.snapshot()
+
+        if frame is not None:
+            self.draw_func(frame[0], frame[1], dirty, frame[2])
+            self.frames_rendered += 1
+        if stats is not None:
+            self.stats_func(*stats)
+
+    def _tick(self) -> None:
+        """Timer callback: flush, measure the frame and re-arm."""
+        started = time.perf_counter()
+        self.flush()
+        self.last_frame_ms = (time.perf_counter() - started) * 1000
+        if self.last_frame_ms > self.interval_ms:
+            self.frames_over_budget += 1
+        self._after_id = self.root.after(
+            frame_delay(self.interval_ms, self.last_frame_ms), self._tick
+        )
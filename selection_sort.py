@@ -3,35 +3,28 @@ Selection Sort Algorithm
 Team Member: Yahia Yasser
 """
 
-import time
+from events import PIVOT, SWAP
 
 
-def selection_sort(array, draw_data, delay_func, is_sorting_func, update_stats_func):
+def selection_sort(array):
     """
     Selection Sort: Finds the minimum element and places it at the beginning.
     Time Complexity: O(n²)
     Space Complexity: O(1)
     Stability: Unstable
+    
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison and swap (see events.py).
     """
     n = len(array)
-    comparisons = 0
-    swaps = 0
 
     for i in range(n - 1):
-        if not is_sorting_func():
-            return
-
         min_idx = i
         min_val = array[i]
         
         for j in range(i + 1, n):
-            if not is_sorting_func():
-                return
-
-            comparisons += 1
-            draw_data([min_idx, j], ['pivot', 'comparing'])
-            update_stats_func(comparisons, swaps)
-            time.sleep(delay_func())
+            # The current minimum is shown as the pivot
+            yield PIVOT, j, min_idx
 
             if array[j] < min_val:
                 min_idx = j
@@ -39,7 +32,16 @@ def selection_sort(array, draw_data, delay_func, is_sorting_func, update_stats_f
 
         if min_idx != i:
             array[i], array[min_idx] = min_val, array[i]
-            swaps += 1
-            draw_data([i, min_idx], ['swapping', 'swapping'])
-            update_stats_func(comparisons, swaps)
-            time.sleep(delay_func())
+            yield SWAP, i, min_idx
+
+
+ALGORITHMS = {
+    "Selection Sort": {
+        "entry": selection_sort,
+        "description": "Finds minimum element and places it at the beginning.\nPerforms well on small datasets.",
+        "time_complexity": "O(n²)",
+        "space_complexity": "O(1)",
+        "stability": "Unstable",
+        "best_case": "O(n²) - always same",
+    },
+}
@@ -0,0 +1,412 @@
+"""
+Sort Traces
+===========
+Record a sorting run once at full speed and replay it at any speed.
+
+A Trace stores the initial array and a flat, array-backed list of
+``(op, a, b)`` records using the opcodes from events.py. WRITE records
+change the array by the value delta in b; every other record is a
+highlight-only "frame". The frame table maps each frame to its record
+offset together with the comparison/swap counts at that point, so the
+statistics panel can be restored for any position.
+
+TracePlayer walks a trace forwards and backwards. WRITE records store
+value deltas, so stepping backwards simply undoes them. Keyframes
+(snapshots of the array every ``keyframe_interval`` frames) bound the
+work needed to jump to an arbitrary frame.
+
+Traces can be saved in a compact little-endian binary format and opened
+again through mmap (see save_trace/MappedTrace), so multi-million-step
+traces load instantly without being copied into Python lists:
+
+    header    TRACE_HEADER (magic, version, sizes, keyframe interval)
+    name      UTF-8 algorithm name, padded to 8 bytes
+    initial   int32[n]
+    records   int32[3 * record_count]      (op, a, b)
+    frames    int64[4 * frame_count]       (record offset, comparisons, swaps, aux peak)
+    keyframes int32[n * keyframe_count]    array state at k * keyframe_interval
+
+Every section starts on an 8-byte boundary.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from counters import SortCounters
+from events import SILENT_OPS, SWAP, WRITE
+
+# Fields per frame table row: record offset, comparisons, swaps, aux peak
+FRAME_FIELDS = 4
+
+# Minimum number of frames between keyframes
+MIN_KEYFRAME_INTERVAL = 1024
+
+TRACE_MAGIC = b'SRTT'
+TRACE_VERSION = 2
+# magic, version, reserved, name length, n, record count, frame count, keyframe interval
+TRACE_HEADER = struct.Struct('<4sHHIqqqq')
+
+
+class Trace:
+    """
+    Compact, array-backed recording of one sorting run.
+
+    Attributes:
+        initial (array): Array values before sorting
+        records (array): Flat (op, a, b) int32 triples
+        frames (array): Flat (record offset, comparisons, swaps, aux peak) rows
+        keyframes (array): Flat array snapshots, one per keyframe_interval frames
+        keyframe_interval (int): Frames between keyframes
+        algorithm (str): Name of the algorithm that produced the trace
+    """
+
+    def __init__(self, initial: Iterable[int]):
+        """
+        Create an empty trace.
+
+        Args:
+            initial: Array values before sorting
+        """
+        self.initial = array('i', initial)
+        self.records = array('i')
+        self.frames = array('q')
+        self.keyframes = array('i')
+        self.keyframe_interval = MIN_KEYFRAME_INTERVAL
+        self.algorithm = ""
+
+    @property
+    def record_count(self) -> int:
+        """Number of (op, a, b) records."""
+        return len(self.records) // 3
+
+    @property
+    def frame_count(self) -> int:
+        """Number of highlight frames."""
+        return len(self.frames) // FRAME_FIELDS
+
+    def record(self, index: int) -> Tuple[int, int, int]:
+        """Return the (op, a, b) record at the given record index."""
+        base = index * 3
+        return self.records[base], self.records[base + 1], self.records[base + 2]
+
+    def frame_offset(self, frame: int) -> int:
+        """Return the record index of the given frame."""
+        return self.frames[frame * FRAME_FIELDS]
+
+    def frame_stats(self, frame: int) -> Tuple[int, int, int]:
+        """Return the (comparisons, swaps, aux peak) counts at the given frame."""
+        base = frame * FRAME_FIELDS
+        return self.frames[base + 1], self.frames[base + 2], self.frames[base + 3]
+
+    def append_write(self, index: int, delta: int) -> None:
+        """Record that array[index] changed by delta."""
+        self.records.extend((WRITE, index, delta))
+
+    def append_frame(self, op: int, a: int, b: int, comparisons: int,
+                     swaps: int, aux_peak: int = 0) -> None:
+        """Record a highlight frame with the statistics at that point."""
+        self.frames.extend((self.record_count, comparisons, swaps, aux_peak))
+        self.records.extend((op, a, b))
+
+    @property
+    def keyframe_count(self) -> int:
+        """Number of stored keyframes."""
+        n = len(self.initial)
+        return len(self.keyframes) // n if n else 0
+
+    def keyframe(self, k: int) -> Sequence[int]:
+        """Return the array snapshot at position k * keyframe_interval."""
+        n = len(self.initial)
+        if k == 0:
+            return self.initial
+        return self.keyframes[(k - 1) * n:k * n]
+
+    def build_keyframes(self) -> None:
+        """
+        Snapshot the array every keyframe_interval frames.
+
+        The interval grows with the array size so the snapshots stay small
+        compared to the records.
+        """
+        n = len(self.initial)
+        self.keyframe_interval = max(MIN_KEYFRAME_INTERVAL, n)
+        self.keyframes = array('i')
+        state = array('i', self.initial)
+        records = self.records
+        start = 0
+        position = self.keyframe_interval
+        while n and position < self.frame_count:
+            end = self.frame_offset(position - 1) + 1
+            for base in range(start * 3, end * 3, 3):
+                if records[base] == WRITE:
+                    state[records[base + 1]] += records[base + 2]
+            self.keyframes.extend(state)
+            start = end
+            position += self.keyframe_interval
+
+
+def record_trace(sort_func: Callable, values: Sequence[int],
+                 is_sorting_func: Callable[[], bool] = lambda: True) -> Trace:
+    """
+    Run a sorting algorithm at full speed and record its trace.
+
+    SWAP and WRITE events become WRITE records holding value deltas,
+    followed by a highlight frame; ALLOC and TALLY events only update the
+    counters; other events become frames directly.
+
+    Args:
+        sort_func: Algorithm generator taking the array (see events.py)
+        values: Array to sort (left unchanged)
+        is_sorting_func: Returns False to abort the recording early
+
+    Returns:
+        The recorded trace
+    """
+    trace = Trace(values)
+    array_ = list(values)
+    shadow = list(values)
+    counters = SortCounters()
+
+    def record_write(index: int) -> None:
+        delta = array_[index] - shadow[index]
+        if delta:
+            trace.append_write(index, delta)
+            shadow[index] = array_[index]
+
+    for op, a, b in sort_func(array_):
+        if not is_sorting_func():
+            break
+        counters.record(op, a, b)
+        if op in SILENT_OPS:
+            continue
+        if op == SWAP:
+            record_write(a)
+            record_write(b)
+        elif op == WRITE:
+            record_write(a)
+            # Trace WRITE records are value deltas; highlight as a swap
+            op = SWAP
+        trace.append_frame(op, a, b, *counters.snapshot())
+
+    trace.build_keyframes()
+    return trace
+
+
+def _padding(size: int) -> bytes:
+    """Return the zero bytes needed to pad size up to an 8-byte boundary."""
+    return b'\0' * (-size % 8)
+
+
+def save_trace(trace: Trace, path: str) -> None:
+    """
+    Write a trace to disk in the binary trace format.
+
+    Args:
+        trace: The trace to save
+        path: Destination file path
+    """
+    name = trace.algorithm.encode('utf-8')
+    header = TRACE_HEADER.pack(
+        TRACE_MAGIC, TRACE_VERSION, 0, len(name), len(trace.initial),
+        trace.record_count, trace.frame_count, trace.keyframe_interval
+    )
+    sections = [header, name, trace.initial, trace.records,
+                trace.frames, trace.keyframes]
+
+    with open(path, 'wb') as f:
+        for section in sections:
+            data = section if isinstance(section, bytes) else _to_little_endian(section)
+            f.write(data)
+            f.write(_padding(len(data)))
+
+
+def _to_little_endian(values) -> bytes:
+    """Return the bytes of an array or memoryview in little-endian order."""
+    if sys.byteorder == 'little':
+        return bytes(values)
+    swapped = array(values.typecode if isinstance(values, array) else values.format, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+class MappedTrace(Trace):
+    """
+    Read-only trace backed by a memory-mapped trace file.
+
+    The sections are exposed as memoryviews into the mapping, so opening a
+    trace costs the same regardless of its length and any record, frame or
+    keyframe is reachable in O(1). On big-endian hosts the file is copied
+    into byte-swapped arrays instead.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a trace file.
+
+        Args:
+            path: Path of a file written by save_trace
+
+        Raises:
+            ValueError: If the file is not a supported trace file
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            (magic, version, _reserved, name_len, n, record_count, frame_count,
+             keyframe_interval) = TRACE_HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Not a sort trace file: {path}")
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported sort trace file: {path}")
+
+        self.keyframe_interval = keyframe_interval
+        keyframe_count = 0
+        if n and frame_count > keyframe_interval:
+            keyframe_count = (frame_count - 1) // keyframe_interval
+
+        view = self._view = memoryview(self._mmap)
+        offset = TRACE_HEADER.size + len(_padding(TRACE_HEADER.size))
+        self.algorithm = bytes(view[offset:offset + name_len]).decode('utf-8')
+        offset += name_len + len(_padding(name_len))
+
+        sections = []
+        for typecode, count in (('i', n), ('i', 3 * record_count),
+                                ('q', FRAME_FIELDS * frame_count),
+                                ('i', n * keyframe_count)):
+            size = count * array(typecode).itemsize
+            if offset + size > len(self._mmap):
+                self.close()
+                raise ValueError(f"Truncated sort trace file: {path}")
+            sections.append(self._section(view, offset, size, typecode))
+            offset += size + len(_padding(size))
+        self.initial, self.records, self.frames, self.keyframes = sections
+
+    def _section(self, view: memoryview, offset: int, size: int, typecode: str):
+        """Return a typed view (or byte-swapped copy) of a file section."""
+        if sys.byteorder == 'little':
+            return view[offset:offset + size].cast(typecode)
+        values = array(typecode, bytes(view[offset:offset + size]))
+        values.byteswap()
+        return values
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        for name in ('initial', 'records', 'frames', 'keyframes'):
+            section = self.__dict__.pop(name, None)
+            if isinstance(section, memoryview):
+                section.release()
+        view = self.__dict__.pop('_view', None)
+        if view is not None:
+            view.release()
+        self._mmap.close()
+
+
+class TracePlayer:
+    """
+    Cursor over a trace that can move forwards, backwards or jump.
+
+    ``position`` counts the frames shown so far: 0 is the initial array and
+    ``trace.frame_count`` is the finished run (including any writes after
+    the last frame).
+
+    Attributes:
+        trace (Trace): The trace being played
+        array (List[int]): Array state at the current position
+        position (int): Number of frames applied
+    """
+
+    def __init__(self, trace: Trace):
+        """
+        Start a player at the beginning of a trace.
+
+        Args:
+            trace: The trace to play
+        """
+        self.trace = trace
+        self.array: List[int] = list(trace.initial)
+        self.position = 0
+
+    @property
+    def finished(self) -> bool:
+        """True when every frame has been applied."""
+        return self.position >= self.trace.frame_count
+
+    def _record_end(self, position: int) -> int:
+        """Return the number of records applied at a position."""
+        if position <= 0:
+            return 0
+        if position >= self.trace.frame_count:
+            return self.trace.record_count
+        return self.trace.frame_offset(position - 1) + 1
+
+    def current_frame(self) -> Optional[Tuple[int, int, int]]:
+        """Return the (op, a, b) of the frame last shown, or None at the start."""
+        if self.position == 0 or self.trace.frame_count == 0:
+            return None
+        return self.trace.record(self.trace.frame_offset(self.position - 1))
+
+    def current_stats(self) -> Tuple[int, int, int]:
+        """Return the (comparisons, swaps, aux peak) counts at the current position."""
+        if self.position == 0 or self.trace.frame_count == 0:
+            return 0, 0, 0
+        return self.trace.frame_stats(self.position - 1)
+
+    def seek(self, position: int) -> List[int]:
+        """
+        Move to a frame position by applying or undoing records.
+
+        Args:
+            position: Target number of frames applied
+
+        Returns:
+            Indices whose values changed (every index after a keyframe jump)
+        """
+        position = max(0, min(position, self.trace.frame_count))
+        records = self.trace.records
+        array_ = self.array
+        dirty = []
+
+        # Long jumps restart from the nearest keyframe at or before the target
+        interval = self.trace.keyframe_interval
+        restored = abs(position - self.position) > interval
+        if restored:
+            k = min(position // interval, self.trace.keyframe_count)
+            array_[:] = self.trace.keyframe(k)
+            self.position = k * interval
+
+        start = self._record_end(self.position)
+        end = self._record_end(position)
+
+        if end >= start:
+            for base in range(start * 3, end * 3, 3):
+                if records[base] == WRITE:
+                    index = records[base + 1]
+                    array_[index] += records[base + 2]
+                    dirty.append(index)
+        else:
+            for base in range((start - 1) * 3, end * 3 - 1, -3):
+                if records[base] == WRITE:
+                    index = records[base + 1]
+                    array_[index] -= records[base + 2]
+                    dirty.append(index)
+
+        self.position = position
+        return list(range(len(array_))) if restored else dirty
+
+    def step(self, count: int = 1) -> List[int]:
+        """
+        Move forwards (or backwards for a negative count) by frames.
+
+        Args:
+            count: Number of frames to move
+
+        Returns:
+            Indices whose values changed
+        """
+        return self.seek(self.position + count)
@@ -0,0 +1,560 @@
+"""
+Tim Sort Algorithm
+Natural merge sort with run detection, binary insertion and galloping merges
+"""
+
+from events import ALLOC, COMPARE, NO_INDEX, SWAP, WRITE
+
+# Arrays shorter than this are sorted with a single binary insertion sort
+MIN_MERGE = 32
+
+# Initial number of consecutive wins by one run before a merge starts galloping
+MIN_GALLOP = 7
+
+
+def tim_sort(array):
+    """
+    Tim Sort: Merges the natural runs already present in the array.
+    Time Complexity: O(n log n), O(n) on presorted input
+    Space Complexity: O(n)
+    Stability: Stable
+
+    The array is scanned for ascending and strictly descending runs
+    (descending ones are reversed in place); runs shorter than a minimum
+    length are extended with binary insertion sort. Runs are pushed on a
+    stack whose lengths are kept roughly Fibonacci-like, which keeps the
+    merges balanced. Each merge first trims the elements that are already
+    in place, then copies the smaller run out and switches to galloping
+    (exponential search) when one run keeps winning.
+
+    Sorts array in place, yielding an (op, a, b) step event after each
+    comparison, swap and write (see events.py).
+    """
+    n = len(array)
+    if n < 2:
+        return
+
+    state = _MergeState(array)
+    min_run = min_run_length(n)
+    lo = 0
+
+    while lo < n:
+        run_end = yield from count_run(array, lo, n)
+        length = run_end - lo
+
+        if length < min_run:
+            forced = min(min_run, n - lo)
+            yield from binary_insertion_sort(array, lo, lo + forced, run_end)
+            length = forced
+
+        state.runs.append((lo, length))
+        yield from state.merge_collapse()
+        lo += length
+
+    yield from state.merge_force_collapse()
+
+
+def min_run_length(n):
+    """
+    Return the minimum run length for an array of n elements.
+
+    Between MIN_MERGE / 2 and MIN_MERGE, chosen so that n / min_run is a
+    power of two or slightly less, which keeps the final merges balanced.
+    """
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def count_run(array, lo, hi):
+    """
+    Find the run starting at lo, reversing it if strictly descending.
+
+    Yields step events and returns the end (exclusive) of the run.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return hi
+
+    yield COMPARE, run_hi, lo
+    if array[run_hi] < array[lo]:
+        # Strictly descending, so reversing it cannot break stability
+        run_hi += 1
+        while run_hi < hi:
+            yield COMPARE, run_hi, run_hi - 1
+            if not array[run_hi] < array[run_hi - 1]:
+                break
+            run_hi += 1
+
+        i, j = lo, run_hi - 1
+        while i < j:
+            array[i], array[j] = array[j], array[i]
+            yield SWAP, i, j
+            i += 1
+            j -= 1
+    else:
+        run_hi += 1
+        while run_hi < hi:
+            yield COMPARE, run_hi, run_hi - 1
+            if array[run_hi] < array[run_hi - 1]:
+                break
+            run_hi += 1
+
+    return run_hi
+
+
+def binary_insertion_sort(array, lo, hi, start):
+    """
+    Sort array[lo:hi], given that array[lo:start] is already sorted.
+
+    The insertion point of each element is found by binary search, so an
+    element costs O(log n) comparisons (its moves are still O(n)).
+    """
+    for i in range(start, hi):
+        pivot = array[i]
+        left, right = lo, i
+
+        while left < right:
+            mid = (left + right) // 2
+            yield COMPARE, i, mid
+            if pivot < array[mid]:
+                right = mid
+            else:
+                left = mid + 1
+
+        for j in range(i, left, -1):
+            array[j] = array[j - 1]
+            yield WRITE, j, j - 1
+        if left != i:
+            array[left] = pivot
+            yield WRITE, left, NO_INDEX
+
+
+def gallop_left(key, key_index, a, base, n, hint, origin=0):
+    """
+    Locate where key belongs in the sorted a[base:base + n], leftmost.
+
+    Gallops from a[base + hint] in steps of 1, 3, 7, 15, ... and then
+    binary searches the last step, so finding position k costs O(log k)
+    comparisons. a is either the array (origin 0) or a merge buffer whose
+    element t was copied from array index origin + t; that index is used
+    in the COMPARE events.
+
+    Yields step events and returns k such that
+    a[base + k - 1] < key <= a[base + k].
+    """
+    last_ofs = 0
+    ofs = 1
+    yield COMPARE, origin + base + hint, key_index
+    if a[base + hint] < key:
+        # a[hint] < key: gallop right until a[hint + last_ofs] < key <= a[hint + ofs]
+        max_ofs = n - hint
+        while ofs < max_ofs:
+            yield COMPARE, origin + base + hint + ofs, key_index
+            if not a[base + hint + ofs] < key:
+                break
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+    else:
+        # key <= a[hint]: gallop left until a[hint - ofs] < key <= a[hint - last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs:
+            yield COMPARE, origin + base + hint - ofs, key_index
+            if a[base + hint - ofs] < key:
+                break
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    # a[last_ofs] < key <= a[ofs]: binary search what's in between
+    last_ofs += 1
+    while last_ofs < ofs:
+        m = last_ofs + ((ofs - last_ofs) >> 1)
+        yield COMPARE, origin + base + m, key_index
+        if a[base + m] < key:
+            last_ofs = m + 1
+        else:
+            ofs = m
+    return ofs
+
+
+def gallop_right(key, key_index, a, base, n, hint, origin=0):
+    """
+    Locate where key belongs in the sorted a[base:base + n], rightmost.
+
+    Like gallop_left, but elements equal to key end up before it.
+
+    Yields step events and returns k such that
+    a[base + k - 1] <= key < a[base + k].
+    """
+    last_ofs = 0
+    ofs = 1
+    yield COMPARE, origin + base + hint, key_index
+    if key < a[base + hint]:
+        # key < a[hint]: gallop left until a[hint - ofs] <= key < a[hint - last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs:
+            yield COMPARE, origin + base + hint - ofs, key_index
+            if not key < a[base + hint - ofs]:
+                break
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        # a[hint] <= key: gallop right until a[hint + last_ofs] <= key < a[hint + ofs]
+        max_ofs = n - hint
+        while ofs < max_ofs:
+            yield COMPARE, origin + base + hint + ofs, key_index
+            if key < a[base + hint + ofs]:
+                break
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last_ofs += hint
+        ofs += hint
+
+    # a[last_ofs] <= key < a[ofs]: binary search what's in between
+    last_ofs += 1
+    while last_ofs < ofs:
+        m = last_ofs + ((ofs - last_ofs) >> 1)
+        yield COMPARE, origin + base + m, key_index
+        if key < a[base + m]:
+            ofs = m
+        else:
+            last_ofs = m + 1
+    return ofs
+
+
+class _MergeState:
+    """
+    The run stack and adaptive gallop threshold of one tim_sort call.
+
+    Attributes:
+        array (list): The array being sorted
+        runs (list): Pending runs as (start, length), bottom first
+        min_gallop (int): Wins in a row needed to enter galloping mode
+    """
+
+    def __init__(self, array):
+        self.array = array
+        self.runs = []
+        self.min_gallop = MIN_GALLOP
+
+    def merge_collapse(self):
+        """
+        Merge runs until the stack invariants hold again.
+
+        For the lengths A, B, C, D of the top four runs: B > C + D,
+        A > B + C and C > D (the fixed form of the original invariant,
+        checking one run deeper).
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            yield from self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merge every remaining run, smaller neighbours first."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            yield from self.merge_at(n)
+
+    def merge_at(self, i):
+        """Merge the adjacent runs i and i + 1 of the stack."""
+        array = self.array
+        base1, len1 = self.runs[i]
+        base2, len2 = self.runs[i + 1]
+        self.runs[i] = (base1, len1 + len2)
+        del self.runs[i + 1]
+
+        # Elements of run 1 not above run 2's first element are in place
+        k = yield from gallop_right(array[base2], base2, array, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # Elements of run 2 not below run 1's last element are in place
+        last = base1 + len1 - 1
+        len2 = yield from gallop_left(array[last], last, array, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        if len1 <= len2:
+            yield from self.merge_lo(base1, len1, base2, len2)
+        else:
+            yield from self.merge_hi(base1, len1, base2, len2)
+
+    def merge_lo(self, base1, len1, base2, len2):
+        """
+        Merge run 1 (copied to a buffer) and run 2 left to right.
+
+        Requires len1 <= len2, run 1's first element greater than run 2's
+        first, and run 1's last element greater than every element of run 2.
+        """
+        array = self.array
+        tmp = array[base1:base1 + len1]
+        yield ALLOC, len1, NO_INDEX
+        i = 0
+        j = base2
+        dest = base1
+        min_gallop = self.min_gallop
+
+        array[dest] = array[j]
+        yield WRITE, dest, j
+        dest += 1
+        j += 1
+        len2 -= 1
+
+        done = len2 == 0 or len1 == 1
+        while not done:
+            count1 = count2 = 0
+
+            # One element at a time until a run wins min_gallop times in a row
+            while True:
+                yield COMPARE, dest, j
+                if array[j] < tmp[i]:
+                    array[dest] = array[j]
+                    yield WRITE, dest, j
+                    dest += 1
+                    j += 1
+                    len2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if len2 == 0:
+                        done = True
+                        break
+                else:
+                    array[dest] = tmp[i]
+                    yield WRITE, dest, NO_INDEX
+                    dest += 1
+                    i += 1
+                    len1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if len1 == 1:
+                        done = True
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Gallop: find how many elements each run wins in a row
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+
+                count1 = yield from gallop_right(array[j], j, tmp, i, len1, 0, base1)
+                for _ in range(count1):
+                    array[dest] = tmp[i]
+                    yield WRITE, dest, NO_INDEX
+                    dest += 1
+                    i += 1
+                len1 -= count1
+                if len1 <= 1:
+                    done = True
+                    break
+
+                array[dest] = array[j]
+                yield WRITE, dest, j
+                dest += 1
+                j += 1
+                len2 -= 1
+                if len2 == 0:
+                    done = True
+                    break
+
+                count2 = yield from gallop_left(tmp[i], NO_INDEX, array, j, len2, 0)
+                for _ in range(count2):
+                    array[dest] = array[j]
+                    yield WRITE, dest, j
+                    dest += 1
+                    j += 1
+                len2 -= count2
+                if len2 == 0:
+                    done = True
+                    break
+
+                array[dest] = tmp[i]
+                yield WRITE, dest, NO_INDEX
+                dest += 1
+                i += 1
+                len1 -= 1
+                if len1 == 1:
+                    done = True
+                    break
+
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            # Penalize leaving galloping mode
+            min_gallop += 1
+
+        self.min_gallop = max(min_gallop, 1)
+
+        if len1 == 1 and len2 > 0:
+            # Run 1's last element goes after everything left in run 2
+            for _ in range(len2):
+                array[dest] = array[j]
+                yield WRITE, dest, j
+                dest += 1
+                j += 1
+        for _ in range(len1):
+            array[dest] = tmp[i]
+            yield WRITE, dest, NO_INDEX
+            dest += 1
+            i += 1
+
+        yield ALLOC, -len(tmp), NO_INDEX
+
+    def merge_hi(self, base1, len1, base2, len2):
+        """
+        Merge run 1 and run 2 (copied to a buffer) right to left.
+
+        Requires len1 >= len2, run 1's first element greater than run 2's
+        first, and run 1's last element greater than every element of run 2.
+        """
+        array = self.array
+        tmp = array[base2:base2 + len2]
+        yield ALLOC, len2, NO_INDEX
+        i = base1 + len1 - 1
+        t = len2 - 1
+        dest = base2 + len2 - 1
+        min_gallop = self.min_gallop
+
+        array[dest] = array[i]
+        yield WRITE, dest, i
+        dest -= 1
+        i -= 1
+        len1 -= 1
+
+        done = len1 == 0 or len2 == 1
+        while not done:
+            count1 = count2 = 0
+
+            # One element at a time until a run wins min_gallop times in a row
+            while True:
+                yield COMPARE, dest, i
+                if tmp[t] < array[i]:
+                    array[dest] = array[i]
+                    yield WRITE, dest, i
+                    dest -= 1
+                    i -= 1
+                    len1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    if len1 == 0:
+                        done = True
+                        break
+                else:
+                    array[dest] = tmp[t]
+                    yield WRITE, dest, NO_INDEX
+                    dest -= 1
+                    t -= 1
+                    len2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    if len2 == 1:
+                        done = True
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Gallop: find how many elements each run wins in a row
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+
+                k = yield from gallop_right(tmp[t], NO_INDEX, array, base1, len1, len1 - 1)
+                count1 = len1 - k
+                for _ in range(count1):
+                    array[dest] = array[i]
+                    yield WRITE, dest, i
+                    dest -= 1
+                    i -= 1
+                len1 -= count1
+                if len1 == 0:
+                    done = True
+                    break
+
+                array[dest] = tmp[t]
+                yield WRITE, dest, NO_INDEX
+                dest -= 1
+                t -= 1
+                len2 -= 1
+                if len2 == 1:
+                    done = True
+                    break
+
+                k = yield from gallop_left(array[i], i, tmp, 0, len2, len2 - 1, base2)
+                count2 = len2 - k
+                for _ in range(count2):
+                    array[dest] = tmp[t]
+                    yield WRITE, dest, NO_INDEX
+                    dest -= 1
+                    t -= 1
+                len2 -= count2
+                if len2 <= 1:
+                    done = True
+                    break
+
+                array[dest] = array[i]
+                yield WRITE, dest, i
+                dest -= 1
+                i -= 1
+                len1 -= 1
+                if len1 == 0:
+                    done = True
+                    break
+
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            # Penalize leaving galloping mode
+            min_gallop += 1
+
+        self.min_gallop = max(min_gallop, 1)
+
+        if len2 == 1 and len1 > 0:
+            # Run 2's first element goes before everything left in run 1
+            for _ in range(len1):
+                array[dest] = array[i]
+                yield WRITE, dest, i
+                dest -= 1
+                i -= 1
+        for _ in range(len2):
+            array[dest] = tmp[t]
+            yield WRITE, dest, NO_INDEX
+            dest -= 1
+            t -= 1
+
+        yield ALLOC, -len(tmp), NO_INDEX
+
+
+ALGORITHMS = {
+    "Tim Sort": {
+        "entry": tim_sort,
+        "description": "Natural merge sort: detects existing runs, extends short ones\nwith binary insertion and merges them with galloping.",
+        "time_complexity": "O(n log n)",
+        "space_complexity": "O(n)",
+        "stability": "Stable",
+        "best_case": "O(n) - already sorted or reversed runs",
+    },
+}
@@ -22,18 +22,45 @@ Version: 2.0.0
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import random
+from tkinter import ttk, messagebox, filedialog
+import math
 import time
 import threading
-from typing import List, Callable, Optional, Dict, Any
+from typing import List, Callable, Optional, Dict, Any, Iterable
 
-# Import sorting algorithm modules
-from bubble_sort import bubble_sort
-from selection_sort import selection_sort
-from insertion_sort import insertion_sort
-from merge_sort import merge_sort
-from quick_sort import quick_sort
+# Sorting algorithm modules are loaded on demand through the registry
+from registry import algorithm_names, get_algorithm
+from render_scheduler import RenderScheduler, frame_delay
+from pacing import PacingController, pace_for_rate
+from counters import SortCounters
+from profiler import Profiler
+from race_mode import RACE_ALGORITHMS, Race
+from array_model import ArrayModel
+from image_renderer import ImageRenderer
+from array_patterns import PATTERNS, SLOW_PATTERNS, generate_array, new_seed
+from events import SILENT_OPS, SWAP, SWAP_OPS, event_highlight
+from sort_trace import MappedTrace, Trace, TracePlayer, record_trace, save_trace
+
+# Array sizes offered by the size slider, which moves on a log scale
+MIN_ARRAY_SIZE = 10
+MAX_ARRAY_SIZE = 1_000_000
+SIZE_SLIDER_STEPS = 1000
+
+# Arrays larger than this are drawn into a pixel buffer (see image_renderer.py)
+# instead of as one canvas rectangle per element
+IMAGE_RENDER_THRESHOLD = 2000
+
+# Operation rates offered by the speed slider, which moves on a log scale
+MIN_OPS_PER_SECOND = 1
+MAX_OPS_PER_SECOND = 1_000_000
+SPEED_SLIDER_STEPS = 600
+DEFAULT_OPS_PER_SECOND = 10
+
+# Steps taken by Shift+Left/Right
+RUN_STEPS = 100
+
+# Refresh interval of the profiler overlay in milliseconds
+PROFILER_REFRESH_MS = 250
 
 
 class SortingVisualizer:
@@ -53,6 +80,7 @@ class SortingVisualizer:
         array_size (int): Current size of the array
         sorting (bool): Flag indicating if sorting is in progress
         speed (float): Delay between visualization steps in seconds
+        ops_per_step (int): Operations (or trace frames) run per step
         comparisons (int): Number of comparisons made during sorting
         swaps (int): Number of swaps made during sorting
         start_time (float): Timestamp when sorting started
@@ -76,10 +104,14 @@ class SortingVisualizer:
         # Initialize state variables
         self.array: List[int] = []
         self.array_size: int = 30
+        self.array_seed: int = 0
+        self._array_request: int = 0  # Bumped per generate_array call
         self.sorting: bool = False
-        self.speed: float = 0.1
+        self.speed: float = 1 / DEFAULT_OPS_PER_SECOND
+        self.ops_per_step: int = 1
         self.comparisons: int = 0
         self.swaps: int = 0
+        self.aux_peak: int = 0
         self.start_time: float = 0
         
         # New feature flags
@@ -87,6 +119,25 @@ class SortingVisualizer:
         self.array_pattern: str = "Random"
         self.paused: bool = False
         
+        # Throttles, pauses and single-steps the live sort thread, whose
+        # operation counts are sampled by the render scheduler
+        self.pacer = PacingController(self.speed)
+        self.counters = SortCounters()
+        self._live: bool = False
+        
+        # Side-by-side comparison of several algorithms ("Race" mode)
+        self._race: Optional[Race] = None
+        
+        # Optional hot-path timings shown as a canvas overlay
+        self.profiler = Profiler()
+        self._profiler_after_id = None
+        self._profiler_due: float = 0.0
+        
+        # Trace recording/playback state ("Replay" mode)
+        self.trace_player: Optional[TracePlayer] = None
+        self._recording: bool = False
+        self._playback_after_id: Optional[str] = None
+        
         # Theme colors - easily customizable color schemes
         self.themes = {
             'dark': {
@@ -118,6 +169,20 @@ class SortingVisualizer:
             'pivot': '#ff6b6b'         # Red - pivot element (for Quick Sort)
         }
         
+        # Retained canvas items for the bars (see draw_array)
+        self._bar_items: List[int] = []
+        self._label_items: List[int] = []
+        self._highlighted: List[int] = []
+        self._bars_dirty: bool = True
+        self._model: ArrayModel = ArrayModel([], self.colors)
+        self._image_renderer: Optional[ImageRenderer] = None
+        self._fill: str = 'normal'
+        
+        # Coalesces frames from the sort thread into a fixed-rate redraw
+        self.render_scheduler = RenderScheduler(
+            self.root, self.draw_array, self._present_stats
+        )
+        
         # Apply initial theme and setup UI
         self._apply_theme()
         self.setup_ui()
@@ -144,6 +209,11 @@ class SortingVisualizer:
             R: Reset array
             T: Toggle theme (dark/light)
             Escape: Stop sorting
+            P: Pause/resume (live sort or playback)
+            Right/Left: Step one operation forward/backward
+            Shift+Right/Shift+Left: Run RUN_STEPS operations forward/backward
+            Home: Rewind playback
+            O: Toggle the profiler overlay
         """
         self.root.bind('<space>', lambda e: self._toggle_sorting())
         self.root.bind('<g>', lambda e: self.generate_array())
@@ -151,6 +221,15 @@ class SortingVisualizer:
         self.root.bind('<t>', lambda e: self._toggle_theme())
         self.root.bind('<T>', lambda e: self._toggle_theme())
         self.root.bind('<Escape>', lambda e: self.stop_sorting())
+        self.root.bind('<p>', lambda e: self.toggle_pause())
+        self.root.bind('<P>', lambda e: self.toggle_pause())
+        self.root.bind('<Right>', lambda e: self.step_playback(1))
+        self.root.bind('<Left>', lambda e: self.step_playback(-1))
+        self.root.bind('<Shift-Right>', lambda e: self.step_playback(RUN_STEPS))
+        self.root.bind('<Shift-Left>', lambda e: self.step_playback(-RUN_STEPS))
+        self.root.bind('<Home>', lambda e: self.seek_playback(0))
+        self.root.bind('<o>', lambda e: self.toggle_profiler())
+        self.root.bind('<O>', lambda e: self.toggle_profiler())
     
     def _toggle_sorting(self) -> None:
         """Toggle between starting and stopping the sort operation."""
@@ -178,6 +257,7 @@ class SortingVisualizer:
         self.canvas.configure(bg=theme['canvas_bg'])
         
         # Redraw array with new theme
+        self._invalidate_bars()
         self.draw_array()
         
         # Update theme button text
@@ -233,8 +313,7 @@ class SortingVisualizer:
         self.algorithm_combo = ttk.Combobox(
             algo_frame, 
             textvariable=self.algorithm_var,
-            values=["Bubble Sort", "Selection Sort", "Insertion Sort", 
-                   "Merge Sort", "Quick Sort"], 
+            values=algorithm_names(), 
             state="readonly", 
             width=15
         )
@@ -253,13 +332,17 @@ class SortingVisualizer:
             bg=theme['bg_secondary']
         ).pack()
         
+        # The slider position maps logarithmically onto the array size
         self.size_var = tk.IntVar(value=30)
+        self.size_position_var = tk.IntVar(value=self._size_to_position(30))
         size_scale = tk.Scale(
             size_frame, 
-            from_=10, 
-            to=100, 
+            from_=0, 
+            to=SIZE_SLIDER_STEPS, 
+            length=200,
             orient='horizontal',
-            variable=self.size_var, 
+            showvalue=False,
+            variable=self.size_position_var, 
             command=self.on_size_change,
             bg=theme['bg_secondary'], 
             fg=theme['text_secondary'], 
@@ -267,6 +350,15 @@ class SortingVisualizer:
         )
         size_scale.pack()
         
+        self.size_label = tk.Label(
+            size_frame, 
+            text=f"{self.size_var.get():,}", 
+            font=('Arial', 9), 
+            fg=theme['text_secondary'], 
+            bg=theme['bg_secondary']
+        )
+        self.size_label.pack()
+        
         # Speed Control
         speed_frame = tk.Frame(control_frame, bg=theme['bg_secondary'])
         speed_frame.pack(side='left', padx=10, pady=10)
@@ -279,16 +371,33 @@ class SortingVisualizer:
             bg=theme['bg_secondary']
         ).pack()
         
-        self.speed_var = tk.StringVar(value="Medium")
-        speed_combo = ttk.Combobox(
+        # The slider position maps logarithmically onto operations per second
+        self.speed_var = tk.IntVar(
+            value=self._rate_to_position(DEFAULT_OPS_PER_SECOND)
+        )
+        speed_scale = tk.Scale(
             speed_frame, 
-            textvariable=self.speed_var,
-            values=["Very Slow", "Slow", "Medium", "Fast", "Very Fast"], 
-            state="readonly", 
-            width=10
+            from_=0, 
+            to=SPEED_SLIDER_STEPS, 
+            length=200,
+            orient='horizontal',
+            showvalue=False,
+            variable=self.speed_var, 
+            command=self.update_speed,
+            bg=theme['bg_secondary'], 
+            fg=theme['text_secondary'], 
+            highlightbackground=theme['bg_secondary']
         )
-        speed_combo.pack(pady=5)
-        speed_combo.bind('<<ComboboxSelected>>', self.update_speed)
+        speed_scale.pack()
+        
+        self.speed_label = tk.Label(
+            speed_frame, 
+            text=f"{DEFAULT_OPS_PER_SECOND:,} ops/s", 
+            font=('Arial', 9), 
+            fg=theme['text_secondary'], 
+            bg=theme['bg_secondary']
+        )
+        self.speed_label.pack()
         
         # NEW FEATURE: Array Pattern Selection
         pattern_frame = tk.Frame(control_frame, bg=theme['bg_secondary'])
@@ -306,13 +415,35 @@ class SortingVisualizer:
         pattern_combo = ttk.Combobox(
             pattern_frame, 
             textvariable=self.pattern_var,
-            values=["Random", "Nearly Sorted", "Reversed", "Few Unique"], 
+            values=PATTERNS, 
             state="readonly", 
-            width=12
+            width=16
         )
         pattern_combo.pack(pady=5)
         pattern_combo.bind('<<ComboboxSelected>>', lambda e: self.generate_array())
         
+        # Playback Mode Selection
+        mode_frame = tk.Frame(control_frame, bg=theme['bg_secondary'])
+        mode_frame.pack(side='left', padx=10, pady=10)
+        
+        tk.Label(
+            mode_frame, 
+            text="🎬 Mode:", 
+            font=('Arial', 10, 'bold'), 
+            fg=theme['text_secondary'], 
+            bg=theme['bg_secondary']
+        ).pack()
+        
+        self.mode_var = tk.StringVar(value="Replay")
+        mode_combo = ttk.Combobox(
+            mode_frame, 
+            textvariable=self.mode_var,
+            values=["Replay", "Live", "Race"], 
+            state="readonly", 
+            width=8
+        )
+        mode_combo.pack(pady=5)
+        
         # ---- Action Buttons ----
         button_frame = tk.Frame(control_frame, bg=theme['bg_secondary'])
         button_frame.pack(side='right', padx=10, pady=10)
@@ -361,9 +492,45 @@ class SortingVisualizer:
         )
         self.theme_btn.pack(side='left', padx=3)
         
+        # ---- Playback Controls ----
+        playback_frame = tk.Frame(self.root, bg=theme['bg_secondary'], relief='raised', bd=2)
+        playback_frame.pack(fill='x', padx=10, pady=5)
+        
+        playback_buttons = [
+            ("⏮️", lambda: self.seek_playback(0)),
+            ("◀️", lambda: self.step_playback(-1)),
+            ("⏯️", self.toggle_pause),
+            ("▶️", lambda: self.step_playback(1)),
+            ("💾 Save", self.save_trace_file),
+            ("📂 Open", self.open_trace_file),
+        ]
+        for text, command in playback_buttons:
+            tk.Button(
+                playback_frame, 
+                text=text, 
+                command=command, 
+                **btn_config
+            ).pack(side='left', padx=3, pady=5)
+        
+        self.seek_var = tk.IntVar(value=0)
+        self.seek_scale = tk.Scale(
+            playback_frame, 
+            from_=0, 
+            to=1, 
+            orient='horizontal',
+            variable=self.seek_var, 
+            command=self._on_seek,
+            showvalue=True,
+            bg=theme['bg_secondary'], 
+            fg=theme['text_secondary'], 
+            highlightbackground=theme['bg_secondary']
+        )
+        self.seek_scale.pack(side='left', fill='x', expand=True, padx=10)
+        
         # ---- Visualization Canvas ----
         self.canvas = tk.Canvas(self.root, bg=theme['canvas_bg'], height=400)
         self.canvas.pack(fill='both', expand=True, padx=10, pady=10)
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
         
         # ---- Information Panel ----
         info_frame = tk.Frame(self.root, bg=theme['bg_secondary'], relief='raised', bd=2)
@@ -431,7 +598,10 @@ class SortingVisualizer:
         ).pack()
         
         # NEW FEATURE: Keyboard Shortcuts Help
-        shortcuts_text = "⌨️ Shortcuts: [Space] Start/Stop | [G] Generate | [T] Theme | [Esc] Stop"
+        shortcuts_text = (
+            "⌨️ Shortcuts: [Space] Start/Stop | [G] Generate | [T] Theme | [Esc] Stop | "
+            "[P] Pause | [←/→] Step | [Shift+←/→] Step 100 | [Home] Rewind | [O] Profiler"
+        )
         tk.Label(
             footer_frame, 
             text=shortcuts_text, 
@@ -455,38 +625,95 @@ class SortingVisualizer:
         - Nearly Sorted: Array with a few elements out of place
         - Reversed: Array in descending order
         - Few Unique: Array with limited unique values (tests stability)
+        - Sawtooth, Organ Pipe, Zipf Duplicates, Sorted Runs
+        - Quicksort Killer: Adversarial input for quick sort
+        
+        Each array gets a fresh seed, shown with the statistics, so the
+        same input can be reproduced in the benchmark (--seeds).
+        
+        Patterns in SLOW_PATTERNS are generated on a separate thread so
+        the window stays responsive; the current array stays on screen
+        until the new one is ready.
         
         Does nothing if sorting is currently in progress.
         """
         if self.sorting:
             return
             
-        self.array_size = self.size_var.get()
         pattern = self.pattern_var.get()
+        size = self.size_var.get()
+        seed = new_seed()
+        self._array_request += 1
+        
+        if pattern in SLOW_PATTERNS:
+            threading.Thread(
+                target=self._generate_array_thread,
+                args=(self._array_request, pattern, size, seed),
+                daemon=True
+            ).start()
+            return
         
         # Generate array based on selected pattern
-        if pattern == "Random":
-            self.array = [random.randint(10, 390) for _ in range(self.array_size)]
-        elif pattern == "Nearly Sorted":
-            # Create sorted array then swap a few random pairs
-            self.array = list(range(10, 10 + self.array_size * 4, 4))[:self.array_size]
-            # Swap ~10% of elements
-            for _ in range(max(1, self.array_size // 10)):
-                i, j = random.sample(range(self.array_size), 2)
-                self.array[i], self.array[j] = self.array[j], self.array[i]
-        elif pattern == "Reversed":
-            # Descending order - worst case for many algorithms
-            self.array = list(range(390, 390 - self.array_size * 4, -4))[:self.array_size]
-        elif pattern == "Few Unique":
-            # Only 5 unique values - tests algorithm behavior with duplicates
-            unique_vals = [50, 150, 200, 300, 350]
-            self.array = [random.choice(unique_vals) for _ in range(self.array_size)]
+        try:
+            array = generate_array(pattern, size, seed)
+        except ValueError as e:
+            messagebox.showerror("Generate Array", str(e))
+            return
+        self._set_array(array, seed)
+    
+    def _generate_array_thread(self, request: int, pattern: str, size: int,
+                               seed: int) -> None:
+        """
+        Generate an array of a slow pattern.
+        
+        This method runs in a separate thread. The array (or the error)
+        is handed to the main thread, which drops it if another array has
+        been requested or a sort has started in the meantime.
+        
+        Args:
+            request: Value of _array_request when the array was requested
+            pattern: Array pattern
+            size: Number of elements
+            seed: Seed for the pattern generator
+        """
+        def deliver(array: Optional[List[int]], error: Optional[str]) -> None:
+            if request != self._array_request or self.sorting:
+                return
+            if error is not None:
+                messagebox.showerror("Generate Array", error)
+            else:
+                self._set_array(array, seed)
+        
+        try:
+            array = generate_array(pattern, size, seed)
+        except ValueError as e:
+            error = str(e)
+            self.root.after(0, lambda: deliver(None, error))
+            return
+        self.root.after(0, lambda: deliver(array, None))
+    
+    def _set_array(self, array: List[int], seed: int) -> None:
+        """
+        Make a freshly generated array the current one and redraw.
+        
+        Args:
+            array: The new array
+            seed: Seed it was generated with
+        """
+        self.array = array
+        self.array_size = len(array)
+        self.array_seed = seed
+        self._set_trace_player(None)
+        self.seek_var.set(0)
         
         self.reset_stats()
+        self._invalidate_bars()
         self.draw_array()
     
     def draw_array(self, colored_indices: Optional[List[int]] = None, 
-                   colors: Optional[List[str]] = None) -> None:
+                   colors: Optional[List[str]] = None,
+                   dirty: Optional[Iterable[int]] = None,
+                   fill: Optional[str] = None) -> None:
         """
         Draw the current array state on the canvas.
         
@@ -494,66 +721,184 @@ class SortingVisualizer:
         of the bar corresponds to the element's value. Bars can be
         colored differently to indicate operations being performed.
         
+        Bars are retained between frames: they are created once per array
+        (see _rebuild_bars) and each call only updates the bars that were
+        highlighted in the previous frame plus the ones highlighted now.
+        Arrays above IMAGE_RENDER_THRESHOLD elements are drawn by an
+        ImageRenderer, which repaints the pixel columns of those bars.
+        
+        Highlight colors live in the model's per-index state array, so a
+        frame costs time proportional to the bars it touches. A frame that
+        colors every bar (the final "sorted" frame) passes fill instead of
+        listing every index: the state array is filled in bulk and the
+        retained bars are recolored with a single tagged canvas call.
+        
+        Must be called on the main thread. It only updates canvas items;
+        Tk repaints them once control returns to the event loop.
+        
         Args:
             colored_indices: List of indices to highlight with special colors
             colors: List of color keys ('comparing', 'swapping', 'sorted', 'pivot')
                    corresponding to each index in colored_indices
+            dirty: Extra indices whose values may have changed since they
+                   were last drawn (e.g. from frames the scheduler dropped)
+            fill: Color key for every bar that is not highlighted
+                 (default 'normal'); it stays until a frame with another fill
         """
-        self.canvas.delete("all")
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
         # Handle case where canvas hasn't been rendered yet
         if canvas_width <= 1 or canvas_height <= 1:
-            self.root.after(100, lambda: self.draw_array(colored_indices, colors))
+            self.root.after(100, lambda: self.draw_array(colored_indices, colors, dirty, fill))
             return
         
-        # Calculate bar dimensions
-        bar_width = (canvas_width - 20) / len(self.array)
-        max_height = canvas_height - 40
-        max_value = max(self.array) if self.array else 1
+        started = time.perf_counter()
+        if self._bars_dirty or self._model.values is not self.array:
+            self._rebuild_bars(canvas_width, canvas_height)
+        
+        model = self._model
+        n = len(self.array)
+        fill = fill or 'normal'
+        
+        # Bars highlighted last frame or written since they were last drawn
+        touched = {i for i in self._highlighted if i < n}
+        touched.update(i for i in dirty or () if i < n)
+        
+        repaint_all = fill != self._fill
+        if repaint_all:
+            fill_color = model.fill(fill)
+            self._fill = fill
+            if self._image_renderer is None:
+                self.canvas.itemconfigure('bar', fill=fill_color)
+        else:
+            for i in touched:
+                model.set_state(i, fill)
+        
+        self._highlighted = []
+        for pos, i in enumerate(colored_indices or []):
+            if not 0 <= i < n:
+                continue
+            key = colors[pos] if colors and pos < len(colors) else 'comparing'
+            model.set_state(i, key)
+            touched.add(i)
+            self._highlighted.append(i)
+        
+        if self._image_renderer is not None:
+            if repaint_all:
+                self._image_renderer.draw_all()
+            else:
+                self._image_renderer.update(touched)
+        else:
+            for i in touched:
+                self._update_bar(i, model.color(i))
+        
+        if self.profiler.enabled:
+            self.profiler.add_frame((time.perf_counter() - started) * 1000)
+    
+    def _rebuild_bars(self, canvas_width: int, canvas_height: int) -> None:
+        """
+        Recreate every bar (and value label) for the current array.
+        
+        Arrays above IMAGE_RENDER_THRESHOLD elements get an ImageRenderer
+        instead of canvas items. Only needed when the array, the canvas size
+        or the theme changes; per-step updates go through _update_bar (or
+        ImageRenderer.update) instead.
+        
+        Args:
+            canvas_width: Current canvas width in pixels
+            canvas_height: Current canvas height in pixels
+        """
+        self.canvas.delete("all")
+        self._bar_items = []
+        self._label_items = []
+        self._highlighted = []
+        self._bars_dirty = False
+        self._image_renderer = None
+        self._fill = 'normal'
+        if self._race is not None:
+            self._race.stop()
+            self._race = None
+        
+        # Bar geometry is computed once per array and canvas size
+        self._model = ArrayModel(self.array, self.colors)
+        if not self.array:
+            return
         
         theme = self.themes['dark' if self.dark_mode else 'light']
+        if len(self.array) > IMAGE_RENDER_THRESHOLD:
+            self._image_renderer = ImageRenderer(
+                self.canvas, self._model, canvas_width, canvas_height,
+                theme['canvas_bg']
+            )
+            self._image_renderer.draw_all()
+            return
         
-        # Draw each bar
-        for i, value in enumerate(self.array):
-            # Calculate bar position
-            x1 = 10 + i * bar_width
-            x2 = x1 + bar_width - 2
-            
-            # Calculate bar height (proportional to value)
-            bar_height = (value / max_value) * max_height
-            y1 = canvas_height - 20
-            y2 = y1 - bar_height
-            
-            # Determine bar color based on state
-            color = self.colors['normal']
-            if colored_indices and i in colored_indices:
-                idx_pos = colored_indices.index(i)
-                if colors and idx_pos < len(colors):
-                    color = self.colors.get(colors[idx_pos], self.colors['normal'])
-                else:
-                    color = self.colors['comparing']
-            
-            # Draw the bar rectangle
-            self.canvas.create_rectangle(
+        self._model.layout(canvas_width, canvas_height)
+        # Outlines would swallow bars that are only a pixel or two wide
+        outline = theme['bg_primary'] if self._model.bar_gap else ''
+        show_labels = self._model.bar_width > 20
+        
+        for i, (x1, y1, x2, y2) in enumerate(self._model.all_coords()):
+            self._bar_items.append(self.canvas.create_rectangle(
                 x1, y1, x2, y2, 
-                fill=color, 
-                outline=theme['bg_primary'], 
-                width=1
-            )
+                fill=self.colors['normal'], 
+                outline=outline, 
+                width=1,
+                tags='bar'
+            ))
             
             # Draw value label if bar is wide enough
-            if bar_width > 20:
-                text_y = y2 - 15 if y2 > 30 else y2 + 15
-                self.canvas.create_text(
-                    (x1 + x2) / 2, text_y, 
-                    text=str(value), 
+            if show_labels:
+                self._label_items.append(self.canvas.create_text(
+                    (x1 + x2) / 2, self._label_y(y2), 
+                    text=str(self.array[i]), 
                     font=('Arial', 8, 'bold'), 
                     fill=theme['text_secondary']
-                )
+                ))
+    
+    @staticmethod
+    def _label_y(bar_top: float) -> float:
+        """Return the y position of a value label for a bar whose top is bar_top."""
+        return bar_top - 15 if bar_top > 30 else bar_top + 15
+    
+    def _update_bar(self, i: int, color: str) -> None:
+        """
+        Move and recolor an existing bar to match array[i].
         
-        self.root.update()
+        Args:
+            i: Index of the bar to update
+            color: Fill color for the bar
+        """
+        x1, y1, x2, y2 = self._model.coords(i)
+        item = self._bar_items[i]
+        self.canvas.coords(item, x1, y1, x2, y2)
+        self.canvas.itemconfigure(item, fill=color)
+        
+        if self._label_items:
+            label = self._label_items[i]
+            self.canvas.coords(label, (x1 + x2) / 2, self._label_y(y2))
+            self.canvas.itemconfigure(label, text=str(self.array[i]))
+    
+    def _invalidate_bars(self) -> None:
+        """Force the next draw_array call to recreate all bars."""
+        self._bars_dirty = True
+    
+    def _on_canvas_resize(self, event=None) -> None:
+        """
+        Handle canvas resize events.
+        
+        Bar geometry depends on the canvas size, so the bars (or the
+        race panes) are rebuilt.
+        
+        Args:
+            event: Optional <Configure> event from the canvas
+        """
+        if self._race is not None:
+            self._layout_race()
+            return
+        self._invalidate_bars()
+        self.draw_array()
     
     def on_size_change(self, value: str) -> None:
         """
@@ -563,31 +908,62 @@ class SortingVisualizer:
         unless sorting is currently in progress.
         
         Args:
-            value: The new size value (as string from Scale widget)
+            value: The new slider position (as string from Scale widget)
         """
-        if not self.sorting:
-            self.generate_array()
+        if self.sorting:
+            return
+        size = self._position_to_size(int(float(value)))
+        if size == self.size_var.get() and len(self.array) == size:
+            return
+        self.size_var.set(size)
+        self.size_label.config(text=f"{size:,}")
+        self.generate_array()
+    
+    @staticmethod
+    def _position_to_size(position: int) -> int:
+        """Map a size slider position to an array size (2 significant digits)."""
+        decades = math.log10(MAX_ARRAY_SIZE / MIN_ARRAY_SIZE)
+        size = MIN_ARRAY_SIZE * 10 ** (decades * position / SIZE_SLIDER_STEPS)
+        return int(float(f"{size:.2g}"))
+    
+    @staticmethod
+    def _size_to_position(size: int) -> int:
+        """Map an array size to the nearest size slider position."""
+        decades = math.log10(MAX_ARRAY_SIZE / MIN_ARRAY_SIZE)
+        return round(math.log10(size / MIN_ARRAY_SIZE) / decades * SIZE_SLIDER_STEPS)
     
     # ==================== SPEED & SETTINGS ====================
     
-    def update_speed(self, event=None) -> None:
+    def update_speed(self, value: Optional[str] = None) -> None:
         """
-        Update the animation speed based on user selection.
+        Update the animation speed from the speed slider.
         
-        Maps user-friendly speed names to actual delay values in seconds.
-        Lower delay = faster animation.
+        The slider selects a target rate in operations per second. Rates
+        up to the render frame rate become a delay between single
+        operations; faster rates run several operations per rendered
+        frame (see pacing.pace_for_rate), so even O(n²) sorts of thousands
+        of elements finish in reasonable time while still animating.
         
         Args:
-            event: Optional event from combobox selection
+            value: Optional new slider position (as string from Scale widget)
         """
-        speed_map = {
-            "Very Slow": 0.5,   # 500ms delay - good for learning
-            "Slow": 0.2,        # 200ms delay
-            "Medium": 0.1,      # 100ms delay - default
-            "Fast": 0.05,       # 50ms delay
-            "Very Fast": 0.01   # 10ms delay - for quick comparisons
-        }
-        self.speed = speed_map.get(self.speed_var.get(), 0.1)
+        rate = self._position_to_rate(self.speed_var.get())
+        self.speed, self.ops_per_step = pace_for_rate(rate, self.render_scheduler.fps)
+        self.pacer.set_delay(self.speed)
+        self.speed_label.config(text=f"{rate:,} ops/s")
+    
+    @staticmethod
+    def _position_to_rate(position: int) -> int:
+        """Map a speed slider position to operations per second (2 significant digits)."""
+        decades = math.log10(MAX_OPS_PER_SECOND / MIN_OPS_PER_SECOND)
+        rate = MIN_OPS_PER_SECOND * 10 ** (decades * position / SPEED_SLIDER_STEPS)
+        return int(float(f"{rate:.2g}"))
+    
+    @staticmethod
+    def _rate_to_position(rate: int) -> int:
+        """Map operations per second to the nearest speed slider position."""
+        decades = math.log10(MAX_OPS_PER_SECOND / MIN_OPS_PER_SECOND)
+        return round(math.log10(rate / MIN_OPS_PER_SECOND) / decades * SPEED_SLIDER_STEPS)
     
     # ==================== ALGORITHM INFORMATION ====================
     
@@ -601,47 +977,9 @@ class SortingVisualizer:
         Args:
             event: Optional event from combobox selection
         """
-        # Comprehensive algorithm information database
-        algo_info = {
-            "Bubble Sort": {
-                "description": "Repeatedly swaps adjacent elements if they're in wrong order.\nSimple but inefficient for large datasets.",
-                "time_complexity": "O(n²)",
-                "space_complexity": "O(1)",
-                "stability": "Stable",
-                "best_case": "O(n) - when already sorted"
-            },
-            "Selection Sort": {
-                "description": "Finds minimum element and places it at the beginning.\nPerforms well on small datasets.",
-                "time_complexity": "O(n²)",
-                "space_complexity": "O(1)",
-                "stability": "Unstable",
-                "best_case": "O(n²) - always same"
-            },
-            "Insertion Sort": {
-                "description": "Builds sorted array one element at a time.\nEfficient for small or nearly sorted datasets.",
-                "time_complexity": "O(n²)",
-                "space_complexity": "O(1)",
-                "stability": "Stable",
-                "best_case": "O(n) - when nearly sorted"
-            },
-            "Merge Sort": {
-                "description": "Divide and conquer algorithm that merges sorted subarrays.\nConsistent O(n log n) performance.",
-                "time_complexity": "O(n log n)",
-                "space_complexity": "O(n)",
-                "stability": "Stable",
-                "best_case": "O(n log n) - always same"
-            },
-            "Quick Sort": {
-                "description": "Partitions array around pivot and recursively sorts.\nFast average case, but O(n²) worst case.",
-                "time_complexity": "O(n log n) avg, O(n²) worst",
-                "space_complexity": "O(log n)",
-                "stability": "Unstable",
-                "best_case": "O(n log n) - balanced partitions"
-            }
-        }
-        
+        # The algorithm's module is imported on first selection
         current_algo = self.algorithm_var.get()
-        info = algo_info.get(current_algo, {})
+        info = get_algorithm(current_algo)
         
         # Format the information text
         info_text = f"📝 {info.get('description', '')}\n"
@@ -665,13 +1003,28 @@ class SortingVisualizer:
         elapsed_time = time.time() - self.start_time if self.start_time else 0
         pattern = self.pattern_var.get() if hasattr(self, 'pattern_var') else "Random"
         
-        stats_text = f"🔢 Array Size: {len(self.array)} ({pattern})\n"
+        stats_text = f"🔢 Array Size: {len(self.array)} ({pattern}, seed {self.array_seed})\n"
         stats_text += f"🔍 Comparisons: {self.comparisons}\n"
         stats_text += f"🔄 Swaps: {self.swaps}\n"
+        stats_text += f"💾 Peak Aux Memory: {self.aux_peak} elements\n"
         stats_text += f"⏱️ Time Elapsed: {elapsed_time:.2f}s"
         
         self.stats_label.config(text=stats_text)
     
+    def _present_stats(self, comparisons: int, swaps: int, aux_peak: int = 0) -> None:
+        """
+        Store a statistics snapshot and refresh the statistics panel.
+        
+        Args:
+            comparisons: Number of comparisons made so far
+            swaps: Number of swaps made so far
+            aux_peak: Peak auxiliary memory so far, in elements
+        """
+        self.comparisons = comparisons
+        self.swaps = swaps
+        self.aux_peak = aux_peak
+        self.update_stats()
+    
     def reset_stats(self) -> None:
         """
         Reset all statistics to their initial values.
@@ -680,6 +1033,7 @@ class SortingVisualizer:
         """
         self.comparisons = 0
         self.swaps = 0
+        self.aux_peak = 0
         self.start_time = 0
         self.update_stats()
     
@@ -691,82 +1045,105 @@ class SortingVisualizer:
         
         Initiates sorting in a separate thread to keep UI responsive.
         Disables control buttons during sorting to prevent conflicts.
+        
+        In "Replay" mode the thread records a trace at full speed and
+        playback starts once it is done; in "Live" mode the algorithm
+        is animated while it runs. "Race" mode runs several algorithms
+        side by side on the main thread instead (see _start_race).
         """
         if self.sorting or not self.array:
             return
         
         self.sorting = True
+        self.paused = False
         self.start_time = time.time()
+        self._set_trace_player(None)
         
         # Update button states
         self.sort_btn.config(state='disabled')
         self.generate_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
         
+        if self.mode_var.get() == "Race":
+            self._start_race()
+            return
+        
         algorithm = self.algorithm_var.get()
+        if self.mode_var.get() == "Replay":
+            self._recording = True
+            target = self._record_sort_algorithm
+        else:
+            self._live = True
+            self.pacer.reset()
+            self.counters.reset()
+            self.render_scheduler.start(self.counters)
+            target = self.run_sort_algorithm
+        
+        args = (algorithm,)
+        if self.profiler.enabled:
+            target, args = self._run_profiled, (target, algorithm)
         
         # Start sorting in a separate thread to keep UI responsive
         sort_thread = threading.Thread(
-            target=self.run_sort_algorithm, 
-            args=(algorithm,),
+            target=target, 
+            args=args,
             name=f"SortThread-{algorithm}"
         )
         sort_thread.daemon = True  # Thread will close when main program exits
         sort_thread.start()
-
+    
     def run_sort_algorithm(self, algorithm: str) -> None:
         """
-        Execute the selected sorting algorithm.
+        Execute the selected sorting algorithm live.
         
-        This method runs in a separate thread. It sets up callback
-        functions that the sorting algorithms use to communicate
-        with the visualization.
+        This method runs in a separate thread. It iterates over the
+        algorithm's step events, hands each one to the render scheduler
+        (thread-safe, coalesced) and waits on the pacing controller after
+        each step, which also handles pause and single-stepping. A step
+        is ops_per_step operations; the indices written in between are
+        handed to the scheduler as dirty. Statistics go into
+        self.counters, which the scheduler samples at frame rate.
+        Stopping simply ends the iteration.
         
         Args:
             algorithm: Name of the sorting algorithm to run
         """
         try:
-            # Callback to update visualization (thread-safe)
-            def draw_callback(indices: List[int], colors: List[str]) -> None:
-                self.root.after(0, lambda: self.draw_array(indices, colors))
-            
-            # Callback to get current delay setting
-            def delay_callback() -> float:
-                return self.speed
-            
-            # Callback to check if sorting should continue
-            def is_sorting_callback() -> bool:
-                return self.sorting
+            record = self.counters.record
+            batched = 0
+            written = []
             
-            # Callback to update statistics (thread-safe)
-            def update_stats_callback(comps: int, swaps: int) -> None:
-                self.comparisons = comps
-                self.swaps = swaps
-                self.root.after(0, self.update_stats)
-
             # Execute the selected algorithm
-            if algorithm == "Bubble Sort":
-                bubble_sort(self.array, draw_callback, delay_callback, 
-                           is_sorting_callback, update_stats_callback)
-            elif algorithm == "Selection Sort":
-                selection_sort(self.array, draw_callback, delay_callback, 
-                              is_sorting_callback, update_stats_callback)
-            elif algorithm == "Insertion Sort":
-                insertion_sort(self.array, draw_callback, delay_callback, 
-                              is_sorting_callback, update_stats_callback)
-            elif algorithm == "Merge Sort":
-                merge_sort(self.array, draw_callback, delay_callback, 
-                          is_sorting_callback, update_stats_callback)
-            elif algorithm == "Quick Sort":
-                quick_sort(self.array, draw_callback, delay_callback, 
-                          is_sorting_callback, update_stats_callback)
+            sort_func = get_algorithm(algorithm)['entry']
+            for op, a, b in sort_func(self.array):
+                if not self.sorting:
+                    break
+                record(op, a, b)
+                if op in SILENT_OPS:
+                    continue
+                if op in SWAP_OPS:
+                    written.append(a)
+                    if op == SWAP:
+                        written.append(b)
+                
+                # Single-stepping while paused goes one operation at a time
+                batched += 1
+                if batched < self.ops_per_step and not self.pacer.paused:
+                    continue
+                batched = 0
+                
+                self.render_scheduler.submit_frame(*event_highlight(op, a, b), written)
+                written = []
+                if self.profiler.enabled:
+                    self.profiler.sample_run()
+                if not self.pacer.wait():
+                    break
+            
+            self.render_scheduler.submit_frame([], [], written)
             
             # Highlight all bars as sorted when complete
             if self.sorting:
-                self.root.after(0, lambda: self.draw_array(
-                    list(range(len(self.array))), 
-                    ['sorted'] * len(self.array)
-                ))
+                self.render_scheduler.submit_frame([], [], fill='sorted')
                 
         except Exception as e:
             # Log errors without crashing the application
@@ -774,16 +1151,32 @@ class SortingVisualizer:
         finally:
             # Always cleanup and re-enable controls
             self.sorting = False
-            self.root.after(0, self.enable_controls)
+            self.root.after(0, self._finish_sorting)
+    
+    def _finish_sorting(self) -> None:
+        """
+        Present the last pending frame and restore the controls.
+        
+        Runs on the main thread once the sort thread has exited.
+        """
+        self._live = False
+        self.paused = False
+        self.render_scheduler.stop()
+        self.enable_controls()
     
     def stop_sorting(self) -> None:
         """
         Stop the current sorting operation.
         
         Sets the sorting flag to False, which causes the sorting
-        algorithm to exit at its next check point.
+        algorithm (or trace recording) to exit at its next check point
+        and halts trace playback.
         """
         self.sorting = False
+        self.pacer.stop()
+        self._cancel_playback_timer()
+        if self._race is not None:
+            self._race.stop()
         self.enable_controls()
     
     def enable_controls(self) -> None:
@@ -794,6 +1187,352 @@ class SortingVisualizer:
         self.generate_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
     
+    # ==================== PROFILER ====================
+    
+    def toggle_profiler(self) -> None:
+        """
+        Show or hide the profiler overlay.
+        
+        While it is shown, draw times, event loop lag and the sort
+        thread's CPU time are measured, and sorts started from now on
+        run under cProfile with the statistics dumped to a pstats file
+        in the working directory when they finish.
+        """
+        profiler = self.profiler
+        profiler.enabled = not profiler.enabled
+        if profiler.enabled:
+            profiler.reset()
+            self._schedule_profiler_refresh()
+        else:
+            if self._profiler_after_id is not None:
+                self.root.after_cancel(self._profiler_after_id)
+                self._profiler_after_id = None
+            self.canvas.delete('profiler')
+    
+    def _run_profiled(self, target: Callable[[str], None], algorithm: str) -> None:
+        """
+        Run a sort thread target under the profiler.
+        
+        Args:
+            target: run_sort_algorithm or _record_sort_algorithm
+            algorithm: Name of the sorting algorithm to run
+        """
+        self.profiler.begin_run()
+        try:
+            target(algorithm)
+        finally:
+            self.profiler.end_run(algorithm)
+    
+    def _schedule_profiler_refresh(self) -> None:
+        """Arm the overlay refresh timer, remembering when it is due."""
+        self._profiler_due = time.perf_counter() + PROFILER_REFRESH_MS / 1000
+        self._profiler_after_id = self.root.after(
+            PROFILER_REFRESH_MS, self._refresh_profiler_overlay
+        )
+    
+    def _refresh_profiler_overlay(self) -> None:
+        """
+        Timer callback: redraw the overlay text.
+        
+        How late this callback runs is the event loop lag: it grows with
+        the backlog of callbacks queued ahead of it.
+        """
+        self.profiler.add_loop_lag((time.perf_counter() - self._profiler_due) * 1000)
+        
+        theme = self.themes['dark' if self.dark_mode else 'light']
+        self.canvas.delete('profiler')
+        self.canvas.create_text(
+            self.canvas.winfo_width() - 10, 10,
+            anchor='ne',
+            justify='left',
+            text=self.profiler.summary(self.render_scheduler),
+            font=('Courier', 9),
+            fill=theme['text_primary'],
+            tags='profiler'
+        )
+        self._schedule_profiler_refresh()
+    
+    # ==================== RACE MODE ====================
+    
+    def _start_race(self) -> None:
+        """
+        Race the RACE_ALGORITHMS side by side on copies of the current array.
+        
+        The canvas is split into one pane per algorithm. A single frame
+        clock on the main loop advances every pane by ops_per_step
+        operations and redraws them all in one pass, with live
+        comparison and swap counters per pane.
+        """
+        self._race = Race(
+            self.root, self.canvas, RACE_ALGORITHMS, self.array, self.colors,
+            pace=lambda: (self.speed, self.ops_per_step),
+            on_finish=self._finish_race,
+            image_threshold=IMAGE_RENDER_THRESHOLD
+        )
+        # The race owns the canvas until the next regular redraw
+        self._invalidate_bars()
+        self._layout_race()
+        self._race.start()
+    
+    def _layout_race(self) -> None:
+        """Lay the race panes out over the whole canvas."""
+        theme = self.themes['dark' if self.dark_mode else 'light']
+        self._race.layout(
+            self.canvas.winfo_width(), self.canvas.winfo_height(),
+            theme['canvas_bg'], theme['text_primary']
+        )
+    
+    def _finish_race(self) -> None:
+        """Restore the controls once every pane has finished."""
+        self.sorting = False
+        self.paused = False
+        self.enable_controls()
+    
+    # ==================== TRACE PLAYBACK ====================
+    
+    def _record_sort_algorithm(self, algorithm: str) -> None:
+        """
+        Record a trace of the selected algorithm at full speed.
+        
+        This method runs in a separate thread. Playback is started on
+        the main thread once recording completes.
+        
+        Args:
+            algorithm: Name of the sorting algorithm to record
+        """
+        trace = None
+        try:
+            sort_func = get_algorithm(algorithm)['entry']
+            trace = record_trace(sort_func, self.array, lambda: self.sorting)
+            trace.algorithm = algorithm
+        except Exception as e:
+            # Log errors without crashing the application
+            print(f"⚠️ Sorting error: {e}")
+        finally:
+            self._recording = False
+            if trace is not None and self.sorting:
+                self.root.after(0, lambda: self._start_playback(trace))
+            else:
+                self.sorting = False
+                self.root.after(0, self._finish_sorting)
+    
+    def _start_playback(self, trace: Trace) -> None:
+        """
+        Begin replaying a recorded trace from its first frame.
+        
+        Args:
+            trace: The recorded trace
+        """
+        self._set_trace_player(TracePlayer(trace))
+        self.seek_scale.config(to=max(trace.frame_count, 1))
+        self._invalidate_bars()
+        self._show_playback_frame([])
+        self._schedule_playback()
+    
+    def _set_trace_player(self, player: Optional[TracePlayer]) -> None:
+        """
+        Replace the current trace player, closing any memory-mapped trace.
+        
+        Args:
+            player: The new player, or None to drop the current trace
+        """
+        old = self.trace_player
+        if old is not None and isinstance(old.trace, MappedTrace):
+            old.trace.close()
+        self.trace_player = player
+        if player is not None:
+            self.array = player.array
+    
+    def save_trace_file(self) -> None:
+        """Save the current trace to a binary trace file."""
+        if self.trace_player is None or self._recording:
+            return
+        
+        path = filedialog.asksaveasfilename(
+            title="Save Sort Trace",
+            defaultextension=".srtt",
+            filetypes=[("Sort traces", "*.srtt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            save_trace(self.trace_player.trace, path)
+        except OSError as e:
+            messagebox.showerror("Save Trace", f"Could not save trace:\n{e}")
+    
+    def open_trace_file(self) -> None:
+        """
+        Open a binary trace file for playback.
+        
+        The file is memory-mapped, so large traces open instantly. Playback
+        starts paused at the first frame.
+        """
+        if self._recording:
+            return
+        
+        path = filedialog.askopenfilename(
+            title="Open Sort Trace",
+            filetypes=[("Sort traces", "*.srtt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            trace = MappedTrace(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Open Trace", f"Could not open trace:\n{e}")
+            return
+        
+        self.stop_sorting()
+        self._set_trace_player(TracePlayer(trace))
+        if trace.algorithm in self.algorithm_combo['values']:
+            self.algorithm_var.set(trace.algorithm)
+            self.update_algorithm_info()
+        self.seek_scale.config(to=max(trace.frame_count, 1))
+        self._invalidate_bars()
+        self._show_playback_frame([])
+    
+    def _schedule_playback(self, frame_ms: float = 0.0) -> None:
+        """
+        Arm the playback timer using the current speed setting.
+        
+        Args:
+            frame_ms: Time the last frame took to present, in milliseconds;
+                     only the rest of the step delay is waited out
+        """
+        self._cancel_playback_timer()
+        self._playback_after_id = self.root.after(
+            frame_delay(self.speed * 1000, frame_ms), self._playback_tick
+        )
+    
+    def _cancel_playback_timer(self) -> None:
+        """Cancel the pending playback timer, if any."""
+        if self._playback_after_id is not None:
+            self.root.after_cancel(self._playback_after_id)
+            self._playback_after_id = None
+    
+    def _playback_tick(self) -> None:
+        """Timer callback: advance playback by ops_per_step frames."""
+        self._playback_after_id = None
+        if not self.sorting or self.paused or self.trace_player is None:
+            return
+        
+        started = time.perf_counter()
+        dirty = self.trace_player.step(self.ops_per_step)
+        self._show_playback_frame(dirty)
+        
+        if self.trace_player.finished:
+            self.sorting = False
+            self.enable_controls()
+        else:
+            self._schedule_playback((time.perf_counter() - started) * 1000)
+    
+    def _show_playback_frame(self, dirty: List[int]) -> None:
+        """
+        Draw the trace player's current frame and its statistics.
+        
+        Args:
+            dirty: Indices whose values changed since the last frame
+        """
+        player = self.trace_player
+        if player.finished and player.trace.frame_count:
+            self.draw_array([], [], dirty, fill='sorted')
+        else:
+            frame = player.current_frame()
+            indices, colors = event_highlight(*frame) if frame else ([], [])
+            self.draw_array(indices, colors, dirty)
+        self._present_stats(*player.current_stats())
+        self.seek_var.set(player.position)
+    
+    def toggle_pause(self) -> None:
+        """
+        Pause or resume a live sort, a race or trace playback.
+        
+        Resuming after playback was stopped continues from the current
+        position.
+        """
+        if self._live:
+            self.paused = not self.paused
+            if self.paused:
+                self.pacer.pause()
+            else:
+                self.pacer.resume()
+            return
+        
+        if self._race is not None and self._race.running:
+            self.paused = not self.paused
+            if self.paused:
+                self._race.pause()
+            else:
+                self._race.resume()
+            return
+        
+        if self.trace_player is None or self._recording:
+            return
+        
+        if self.sorting and not self.paused:
+            self.paused = True
+            self._cancel_playback_timer()
+            return
+        
+        if self.trace_player.finished:
+            return
+        self.paused = False
+        if not self.sorting:
+            self.sorting = True
+            self.sort_btn.config(state='disabled')
+            self.generate_btn.config(state='disabled')
+            self.stop_btn.config(state='normal')
+        self._schedule_playback()
+    
+    def step_playback(self, count: int) -> None:
+        """
+        Pause playback and move forwards or backwards by frames.
+        
+        During a live sort or a race this pauses the sort and lets it run
+        count more operations instead; it cannot step backwards.
+        
+        Args:
+            count: Number of frames to move (negative steps backwards)
+        """
+        if self._live:
+            if count > 0:
+                self.paused = True
+                self.pacer.step(count)
+        elif self._race is not None and self._race.running:
+            if count > 0:
+                self.paused = True
+                self._race.step(count)
+        elif self.trace_player is not None:
+            self.seek_playback(self.trace_player.position + count)
+    
+    def seek_playback(self, position: int) -> None:
+        """
+        Pause playback and jump to a frame position.
+        
+        Args:
+            position: Target number of frames applied
+        """
+        if self.trace_player is None or self._recording:
+            return
+        
+        if self.sorting:
+            self.paused = True
+            self._cancel_playback_timer()
+        
+        dirty = self.trace_player.seek(position)
+        self._show_playback_frame(dirty)
+    
+    def _on_seek(self, value: str) -> None:
+        """
+        Handle seek slider changes.
+        
+        Args:
+            value: The new frame position (as string from Scale widget)
+        """
+        position = int(float(value))
+        if self.trace_player is not None and position != self.trace_player.position:
+            self.seek_playback(position)
+    
     # ==================== APPLICATION MAIN LOOP ====================
     
     def run(self) -> None: